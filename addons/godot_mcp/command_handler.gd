@@ -12,7 +12,7 @@ func set_editor_plugin(plugin):
 func handle_command(command_type, params):
 	match command_type:
 		"GET_SCENE_INFO":
-			return handle_get_scene_info()
+			return handle_get_scene_info(params)
 		"OPEN_SCENE":
 			return handle_open_scene(params)
 		"SAVE_SCENE":
@@ -27,6 +27,8 @@ func handle_command(command_type, params):
 			return handle_delete_object(params)
 		"FIND_OBJECTS_BY_NAME":
 			return handle_find_objects_by_name(params)
+		"RENAME_NODE":
+			return handle_rename_node(params)
 		"GET_OBJECT_PROPERTIES":
 			return handle_get_object_properties(params)
 		"SET_PROPERTY":
@@ -41,6 +43,8 @@ func handle_command(command_type, params):
 			return handle_get_asset_list(params)
 		"VIEW_SCRIPT":
 			return handle_view_script(params)
+		"STAT_SCRIPT":
+			return handle_stat_script(params)
 		"SET_NESTED_PROPERTY":
 			return handle_set_nested_property(params)
 		"SET_PARENT":
@@ -77,20 +81,33 @@ func handle_command(command_type, params):
 			return {"error": "Unknown command type: " + command_type}
 
 # Scene commands
-func handle_get_scene_info():
+func handle_get_scene_info(params):
 	var editor_interface = editor_plugin.get_editor_interface()
 	var current_scene = editor_interface.get_edited_scene_root()
 	
 	if current_scene == null:
 		return {"error": "No scene is currently open"}
 	
+	# A compact reply only carries what a tree view shows: names, types, scripts and positions
+	var compact = params.get("compact", false)
+	
 	var scene_info = {
 		"name": current_scene.name,
-		"path": current_scene.scene_file_path,
-		"hierarchy": _get_hierarchy_recursive(current_scene),
-		"root_objects": []
+		"path": current_scene.scene_file_path
 	}
 	
+	# Columns send the compact hierarchy as parallel arrays instead of nested dictionaries
+	if compact and params.get("columns", false):
+		scene_info["columns"] = _get_hierarchy_columns(current_scene)
+		return scene_info
+	
+	scene_info["hierarchy"] = _get_hierarchy_recursive(current_scene, compact)
+	
+	if compact:
+		return scene_info
+	
+	scene_info["root_objects"] = []
+	
 	# Get root-level nodes
 	for child in current_scene.get_children():
 		scene_info.root_objects.append({
@@ -101,7 +118,7 @@ func handle_get_scene_info():
 	return scene_info
 
 # Helper function to recursively build hierarchy
-func _get_hierarchy_recursive(node):
+func _get_hierarchy_recursive(node, compact = false):
 	var hierarchy = {
 		"name": node.name,
 		"type": node.get_class(),
@@ -109,7 +126,11 @@ func _get_hierarchy_recursive(node):
 	}
 	
 	# Add transform info for spatial nodes
-	if node is Node3D:
+	if compact and node is Node3D:
+		hierarchy["transform"] = {"position": [node.position.x, node.position.y, node.position.z]}
+	elif compact and node is Node2D:
+		hierarchy["transform"] = {"position": [node.position.x, node.position.y]}
+	elif node is Node3D:
 		hierarchy["transform"] = {
 			"position": [node.position.x, node.position.y, node.position.z],
 			"rotation": [node.rotation_degrees.x, node.rotation_degrees.y, node.rotation_degrees.z],
@@ -128,10 +149,39 @@ func _get_hierarchy_recursive(node):
 	
 	# Add all child nodes recursively
 	for child in node.get_children():
-		hierarchy["children"].append(_get_hierarchy_recursive(child))
+		hierarchy["children"].append(_get_hierarchy_recursive(child, compact))
 	
 	return hierarchy
 
+# Pre-order node list where each node stores the index of its parent (-1 for the root)
+func _get_hierarchy_columns(root):
+	var columns = {"names": [], "types": [], "scripts": [], "positions": [], "parents": []}
+	var stack = [[root, -1]]
+	
+	while not stack.is_empty():
+		var entry = stack.pop_back()
+		var node = entry[0]
+		var index = columns.names.size()
+		
+		columns.names.append(String(node.name))
+		columns.types.append(node.get_class())
+		columns.scripts.append(node.get_script().resource_path if node.get_script() else null)
+		columns.parents.append(entry[1])
+		
+		if node is Node3D:
+			columns.positions.append([node.position.x, node.position.y, node.position.z])
+		elif node is Node2D:
+			columns.positions.append([node.position.x, node.position.y])
+		else:
+			columns.positions.append(null)
+		
+		# Push children in reverse so they are visited in scene order
+		var children = node.get_children()
+		for i in range(children.size() - 1, -1, -1):
+			stack.append([children[i], index])
+	
+	return columns
+
 func handle_open_scene(params):
 	if not params.has("scene_path"):
 		return {"error": "Missing required parameter: scene_path"}
@@ -469,6 +519,30 @@ func _get_node_path(node):
 		return current_scene.get_path_to(node)
 	return node.get_path()
 
+func handle_rename_node(params):
+	if not params.has("old_name") or not params.has("new_name"):
+		return {"error": "Missing required parameters: old_name and new_name"}
+	
+	var old_name = str(params.old_name)
+	var new_name = str(params.new_name)
+	var editor_interface = editor_plugin.get_editor_interface()
+	var current_scene = editor_interface.get_edited_scene_root()
+	
+	if current_scene == null:
+		return {"error": "No scene is currently open"}
+	
+	# Both names are checked here so a rename takes a single round-trip
+	var node = current_scene if current_scene.name == old_name else _find_node(current_scene, old_name)
+	if node == null:
+		return {"error": "Node '" + old_name + "' not found"}
+	
+	var existing = current_scene if current_scene.name == new_name else current_scene.find_child(new_name, true, false)
+	if existing != null and existing != node:
+		return {"error": "Name '" + new_name + "' is already taken by another node"}
+	
+	node.name = new_name
+	return {"message": "Renamed node from '" + old_name + "' to '" + new_name + "'", "name": str(node.name)}
+
 func handle_get_object_properties(params):
 	if not params.has("name"):
 		return {"error": "Missing required parameter: name"}
@@ -592,6 +666,10 @@ func handle_get_asset_list(params):
 	var type = params.get("type", "")
 	var search_pattern = params.get("search_pattern", "*")
 	var folder = params.get("folder", "res://")
+	# Optional file extension (without the dot) that names must have
+	var extension_filter = params.get("extension", "").to_lower()
+	# Maximum number of assets to return; 0 means no limit
+	var limit = int(params.get("limit", 0))
 	
 	var assets = []
 	var dir = DirAccess.open(folder)
@@ -610,7 +688,7 @@ func handle_get_asset_list(params):
 			pass
 		else:
 			# Check if it matches the search pattern
-			if search_pattern == "*" or search_pattern in file_name:
+			if (search_pattern == "*" or search_pattern in file_name) and (extension_filter == "" or file_name.get_extension().to_lower() == extension_filter):
 				# Check type if specified
 				var add_file = true
 				if type != "":
@@ -634,6 +712,9 @@ func handle_get_asset_list(params):
 						"path": full_path,
 						"type": _get_resource_type(full_path)
 					})
+					# Stop scanning once enough assets were found
+					if limit > 0 and assets.size() >= limit:
+						break
 		
 		file_name = dir.get_next()
 	
@@ -678,7 +759,19 @@ func handle_view_script(params):
 		return {"error": "Failed to open script file: " + script_path}
 	
 	var content = file.get_as_text()
-	return {"exists": true, "content": content}
+	return {"exists": true, "content": content, "mtime": FileAccess.get_modified_time(script_path)}
+
+func handle_stat_script(params):
+	if not params.has("script_path"):
+		return {"error": "Missing required parameter: script_path"}
+	
+	var script_path = params.script_path
+	
+	# Lets the server check whether its cached copy of a script is still current
+	if not FileAccess.file_exists(script_path):
+		return {"exists": false}
+	
+	return {"exists": true, "mtime": FileAccess.get_modified_time(script_path)}
 
 func handle_create_script(params):
 	if not params.has("script_name"):
@@ -794,7 +887,18 @@ func handle_list_scripts(params):
 		file_name = dir.get_next()
 	
 	dir.list_dir_end()
-	return {"scripts": scripts}
+	
+	# Optional paging for folders with many scripts
+	var total = scripts.size()
+	var offset = int(params.get("offset", 0))
+	var limit = int(params.get("limit", -1))
+	if offset > 0 or limit >= 0:
+		scripts = scripts.slice(offset, total if limit < 0 else offset + limit)
+	
+	# "text" returns the listing already joined, one path per line
+	if params.get("format", "") == "text":
+		return {"text": "\n".join(PackedStringArray(scripts)), "total": total}
+	return {"scripts": scripts, "total": total}
 
 # Editor control commands
 func handle_editor_control(params):
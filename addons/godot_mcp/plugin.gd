@@ -78,29 +78,36 @@ func _process(delta):
 		i += 1
 
 func _read_message(connection):
-	# Read data from the connection
-	var data = PackedByteArray()
-	var bytes_available = connection.get_available_bytes()
+	# Each message is a 4-byte little-endian length followed by that many bytes of JSON
+	if connection.get_available_bytes() < 4:
+		return {}
 	
-	if bytes_available > 0:
-		data = connection.get_data(bytes_available)[1]
-		
-		# Attempt to parse as JSON
-		var json_string = data.get_string_from_utf8()
-		var json = JSON.new()
-		var error = json.parse(json_string)
-		
-		if error == OK:
-			return json.get_data()
-		else:
-			print("Failed to parse JSON: ", json.get_error_message())
+	var length = connection.get_u32()
+	var result = connection.get_data(length)
+	if result[0] != OK:
+		print("Failed to read message: ", result[0])
+		return {}
+	
+	# Attempt to parse as JSON
+	var json_string = result[1].get_string_from_utf8()
+	var json = JSON.new()
+	var error = json.parse(json_string)
+	
+	if error == OK:
+		return json.get_data()
+	else:
+		print("Failed to parse JSON: ", json.get_error_message())
 			
 	return {}
 
 func _send_message(connection, data):
-	# Convert to JSON and send
-	var json_string = JSON.stringify(data)
-	connection.put_data(json_string.to_utf8_buffer())
+	# Convert to JSON (keeping key order) and prefix it with its length
+	var body = JSON.stringify(data, "", false).to_utf8_buffer()
+	var message = PackedByteArray()
+	message.resize(4)
+	message.encode_u32(0, body.size())
+	message.append_array(body)
+	connection.put_data(message)
 
 
 
@@ -124,6 +131,20 @@ func _process_command(data):
 	if command_type == "ping":
 		return {"status": "success", "result": {"message": "pong"}}
 	
+	if command_type == "BATCH":
+		# Run each command in order and send all of their responses back in one message
+		var results = []
+		var stop_on_error = params.get("stop_on_error", false)
+		var failed = false
+		for command in params.get("commands", []):
+			if failed:
+				results.append({"status": "error", "error": "Skipped because an earlier command in the batch failed"})
+				continue
+			var response = _process_command(command)
+			failed = stop_on_error and response.get("status") == "error"
+			results.append(response)
+		return {"status": "success", "result": {"results": results}}
+	
 	# Forward to command handler
 	var result = command_handler.handle_command(command_type, params)
 	
@@ -7,16 +7,20 @@ This file contains all configurable parameters for the server.
 from dataclasses import dataclass
 import os
 from pathlib import Path
+from typing import Optional
 
-# Load .env file if it exists
-try:
-    from dotenv import load_dotenv
-    # Look for .env file in the python directory
-    env_path = Path(__file__).parent / '.env'
-    load_dotenv(env_path)
-except ImportError:
-    # python-dotenv not installed, just use system env vars
-    pass
+# Look for .env file in the python directory
+env_path = Path(__file__).parent / '.env'
+
+# Load .env file if it exists; MESHY_API_KEY is the only setting read from it,
+# so skip the dotenv import and parse entirely when it is already set
+if env_path.is_file() and not os.environ.get("MESHY_API_KEY"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(env_path, override=False)
+    except ImportError:
+        # python-dotenv not installed, just use system env vars
+        pass
 
 @dataclass
 class ServerConfig:
@@ -29,7 +33,11 @@ class ServerConfig:
     
     # Connection settings
     connection_timeout: float = 300.0  # 5 minutes timeout
+    startup_connect_timeout: float = 2.0  # Startup doesn't wait longer than this for Godot
     buffer_size: int = 1024 * 1024  # 1MB buffer for localhost
+    socket_buffer_size: int = 4 * 1024 * 1024  # 4MB kernel send/receive buffers
+    connection_pool_size: int = 4  # Connections shared by concurrent async tool calls
+    coalesce_writes: bool = True  # Property/transform writes issued while one is in flight share one BATCH
     
     # Logging settings
     log_level: str = "INFO"
@@ -40,14 +48,21 @@ class ServerConfig:
     retry_delay: float = 1.0
     
     # Meshy API settings
-    # API key loaded from environment variable
-    meshy_api_key: str = os.getenv("MESHY_API_KEY")
     meshy_base_url: str = "https://api.meshy.ai/openapi"  # Official API base URL
     meshy_timeout: int = 300  # 5 minutes for mesh generation
     meshy_download_timeout: int = 60  # 1 minute for downloading
+    # Downloaded meshes are kept here so re-imports skip the download
+    mesh_cache_dir: str = os.path.join(Path.home(), ".cache", "godot-mcp", "meshes")
+    mesh_cache_max_bytes: int = 2 * 1024 ** 3
     
     # Asset import settings
     asset_import_path: str = "res://assets/generated_meshes/"
+    asset_list_cache_ttl: float = 5.0  # Seconds an asset listing is reused for
+
+    @property
+    def meshy_api_key(self) -> Optional[str]:
+        """Meshy API key, read from the environment when Meshy tools need it."""
+        return os.getenv("MESHY_API_KEY")
 
 # Create a global config instance
 config = ServerConfig()
\ No newline at end of file
@@ -1,196 +1,337 @@
 # godot_connection.py
+import asyncio
+import atexit
 import socket
 import json
 import logging
+import logging.handlers
+import queue
+import struct
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Tuple
 from config import config
 
-# Configure logging using settings from config
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format=config.log_format
-)
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, fall back to the standard library
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    # One compact encoder and one decoder shared by every command
+    _encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    _decode = json.JSONDecoder().decode
+
+    def _dumps(obj: Any) -> bytes:
+        return _encode(obj).encode('utf-8')
+
+    def _loads(data) -> Any:
+        # The decoder works on str, so decode the bytes (or memoryview) first
+        return _decode(str(data, 'utf-8'))
+
+# Configure the GodotMCP logger without touching the root logger of the host process
 logger = logging.getLogger("GodotMCP")
+logger.setLevel(config.log_level)
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter(config.log_format))
+    # Callers only enqueue records; a listener thread does the locked stream writes
+    _log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    # Records are already emitted above; don't repeat them through root handlers
+    logger.propagate = False
+
+# The ping request never changes, so it is encoded once
+_PING_BYTES = b'{"type":"ping","params":{}}'
+
+# Every message is prefixed with its length as a 4-byte little-endian integer
+_HEADER = struct.Struct("<I")
+
+
+def _frame(payload: bytes) -> bytes:
+    """Prefix a payload with its length so the receiver knows where it ends."""
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _enable_quickack(sock) -> None:
+    """Ask the kernel to ACK immediately instead of delaying (Linux only).
+
+    The kernel clears this flag again after receiving, so it has to be
+    re-armed around every read.
+    """
+    if sock is None or not hasattr(socket, "TCP_QUICKACK"):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+
+class GodotCommandError(Exception):
+    """Raised when Godot reports that a command failed; the connection stays usable."""
+
+
+def _unwrap_response(response: Dict[str, Any], command_type: str) -> Dict[str, Any]:
+    """Return the result from Godot's status envelope, raising on a reported error."""
+    if response.get("status") == "error":
+        error_message = response.get("error") or response.get("message", "Unknown Godot error")
+        logger.error("Godot error: %s", error_message)
+        raise GodotCommandError(error_message)
+    
+    result = response.get("result")
+    if result is None:
+        logger.warning("Response missing 'result' field for command: %s", command_type)
+        return {}
+        
+    return result
+
+
+def _batch_results(responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn the per-command envelopes of a BATCH reply into results or {"error": message}."""
+    results = []
+    for response in responses:
+        if response.get("status") == "error":
+            results.append({"error": response.get("error") or response.get("message", "Unknown Godot error")})
+        else:
+            results.append(response.get("result") or {})
+    return results
+
 
 @dataclass
-class GodotConnection:
-    """Manages the socket connection to the Godot Editor."""
+class AsyncGodotConnection:
+    """Manages an asyncio stream connection to the Godot Editor."""
     host: str = config.godot_host
     port: int = config.godot_port
-    sock: socket.socket = None  # Socket for Godot communication
+    reader: asyncio.StreamReader = None  # Buffered stream that responses are read from
+    writer: asyncio.StreamWriter = None  # Stream that commands are written to
+
+    async def __aenter__(self) -> "AsyncGodotConnection":
+        if not await self.connect():
+            raise ConnectionError("Could not connect to Godot. Ensure the Godot Editor and MCP Bridge are running.")
+        return self
 
-    def connect(self) -> bool:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def connect(self) -> bool:
         """Establish a connection to the Godot Editor."""
-        if self.sock:
+        if self.writer:
             return True
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Godot at {self.host}:{self.port}")
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, limit=config.buffer_size),
+                config.connection_timeout
+            )
+            # asyncio already disables Nagle's algorithm; size the kernel buffers for large responses
+            sock = self.writer.get_extra_info("socket")
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, config.socket_buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, config.socket_buffer_size)
+            _enable_quickack(sock)
+            logger.info("Connected to Godot at %s:%s", self.host, self.port)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Godot: {str(e)}")
-            self.sock = None
+            logger.error("Failed to connect to Godot: %s", e)
+            self.reader = None
+            self.writer = None
             return False
 
-    def disconnect(self):
+    async def aclose(self) -> None:
         """Close the connection to the Godot Editor."""
-        if self.sock:
+        if self.writer:
+            writer = self.writer
+            self.reader = None
+            self.writer = None
             try:
-                self.sock.close()
+                writer.close()
+                await writer.wait_closed()
             except Exception as e:
-                logger.error(f"Error disconnecting from Godot: {str(e)}")
-            finally:
-                self.sock = None
-
-    def receive_full_response(self, sock, buffer_size=config.buffer_size) -> bytes:
-        """Receive a complete response from Godot, handling chunked data."""
-        chunks = []
-        sock.settimeout(config.connection_timeout)  # Use timeout from config
-        try:
-            while True:
-                chunk = sock.recv(buffer_size)
-                if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
-                    break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
-                
-                # Check if we've received a complete response
-                try:
-                    # Special case for ping-pong
-                    if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
-                        logger.debug("Received ping response")
-                        return data
-                    
-                    # Validate JSON format
-                    json.loads(decoded_data)
-                    
-                    # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # We haven't received a complete valid JSON response yet
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    # Continue reading more chunks as this might not be the complete response
-                    continue
-        except socket.timeout:
-            logger.warning("Socket timeout during receive")
-            raise Exception("Timeout receiving Godot response")
-        except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
+                logger.error("Error disconnecting from Godot: %s", e)
 
+    def is_alive(self) -> bool:
+        """Check that Godot has not closed the idle connection."""
+        return self.writer is not None and not self.writer.is_closing() and not self.reader.at_eof()
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def _receive_full_response(self) -> bytes:
+        """Receive a complete length-prefixed response from Godot."""
+        sock = self.writer.get_extra_info("socket")
+        _enable_quickack(sock)
+        (length,) = _HEADER.unpack(await self.reader.readexactly(_HEADER.size))
+        data = await self.reader.readexactly(length)
+        _enable_quickack(sock)
+        logger.debug("Received complete response (%s bytes)", length)
+        return data
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Godot and return its response."""
-        if not self.sock and not self.connect():
+        logger.debug("Sending command: %s with params: %s", command_type, params)
+        return await self.send_raw(_dumps({"type": command_type, "params": params or {}}), command_type)
+
+    async def send_raw(self, payload: bytes, command_type: str) -> Dict[str, Any]:
+        """Send a command that is already serialized to JSON and return its response.
+
+        Lets callers encode fixed commands once; command_type is only used for logging.
+        """
+        if not self.writer and not await self.connect():
             raise ConnectionError("Not connected to Godot")
-        
-        # Special handling for ping command
-        if command_type == "ping":
-            try:
-                logger.debug("Sending ping to verify connection")
-                ping_command = json.dumps({"type": "ping", "params": {}}).encode('utf-8')
-                self.sock.sendall(ping_command)
-                response_data = self.receive_full_response(self.sock)
-                
-                if not response_data:
-                    logger.warning("Received empty ping response")
-                    self.sock = None
-                    raise ConnectionError("Empty ping response")
-                    
-                response = json.loads(response_data.decode('utf-8'))
-                
-                if not response or response.get("status") != "success":
-                    logger.warning(f"Ping response was not successful: {response}")
-                    self.sock = None
-                    raise ConnectionError("Connection verification failed")
-                    
-                return {"message": "pong"}
-            except Exception as e:
-                logger.error(f"Ping error: {str(e)}")
-                self.sock = None
-                raise ConnectionError(f"Connection verification failed: {str(e)}")
-        
-        # Normal command handling
-        command = {"type": command_type, "params": params or {}}
         try:
-            logger.info(f"Sending command: {command_type} with params: {params}")
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            response_data = self.receive_full_response(self.sock)
-            
-            if not response_data:
-                logger.warning(f"Received empty response for command: {command_type}")
-                raise Exception("Empty response from Godot")
-                
-            response = json.loads(response_data.decode('utf-8'))
+            self.writer.write(_frame(payload))
+            # Large frames (script contents, coalesced batches) wait for the transport to drain
+            await self.writer.drain()
+            response_data = await asyncio.wait_for(self._receive_full_response(), config.connection_timeout)
+            response = _loads(response_data)
             
             if not response:
-                logger.warning(f"Failed to parse response JSON for command: {command_type}")
-                raise Exception("Invalid JSON response from Godot")
-                
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Godot error")
-                logger.error(f"Godot error: {error_message}")
-                raise Exception(error_message)
+                logger.warning("Failed to parse response JSON for command: %s", command_type)
+                raise ConnectionError("Invalid JSON response from Godot")
+        except (OSError, EOFError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            # Timeouts and short reads leave the stream out of sync, so drop the connection
+            logger.error("Communication error with Godot: %s", e)
+            await self.aclose()
+            raise ConnectionError(f"Failed to communicate with Godot: {str(e)}")
             
-            result = response.get("result")
-            if result is None:
-                logger.warning(f"Response missing 'result' field for command: {command_type}")
-                return {}
-                
-            return result
-        except Exception as e:
-            logger.error(f"Communication error with Godot: {str(e)}")
-            self.sock = None
-            raise Exception(f"Failed to communicate with Godot: {str(e)}")
-    
-# Global Godot connection
-_godot_connection = None
+        # Errors reported by Godot leave the connection usable
+        return _unwrap_response(response, command_type)
+
+    async def send_commands_batch(self, commands: List[Tuple[str, Dict[str, Any]]],
+                                  stop_on_error: bool = False) -> List[Dict[str, Any]]:
+        """Send several commands in one round-trip and return their results in order.
+
+        A command that fails on the Godot side yields {"error": message} in its slot.
+        With stop_on_error, the commands after a failure are skipped and report an error too.
+        """
+        batch = [{"type": command_type, "params": params or {}} for command_type, params in commands]
+        response = await self.send_command("BATCH", {"commands": batch, "stop_on_error": stop_on_error})
+        return _batch_results(response.get("results", []))
+
+
+class GodotConnectionPool:
+    """A fixed set of Godot connections shared by concurrent async tool calls."""
 
-def get_godot_connection() -> GodotConnection:
-    """Retrieve or establish a persistent Godot connection."""
-    global _godot_connection
-    if _godot_connection is not None:
+    def __init__(self, size: int = config.connection_pool_size):
+        # Last in, first out, so sequential calls keep reusing the one warm socket
+        self._pool: asyncio.LifoQueue = asyncio.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._pool.put_nowait(AsyncGodotConnection())
+        # Writes queued behind the one in flight, and the task sending them
+        self._pending_writes: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._write_task: asyncio.Task = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncGodotConnection]:
+        """Borrow a verified connection for the duration of an async with block."""
+        conn = await self._pool.get()
         try:
-            # Try to ping with a short timeout to verify connection
-            result = _godot_connection.send_command("ping")
-            # If we get here, the connection is still valid
-            logger.debug("Reusing existing Godot connection")
-            return _godot_connection
-        except Exception as e:
-            logger.warning(f"Existing connection failed: {str(e)}")
-            try:
-                _godot_connection.disconnect()
-            except:
-                pass
-            _godot_connection = None
-    
-    # Create a new connection
-    logger.info("Creating new Godot connection")
-    _godot_connection = GodotConnection()
-    if not _godot_connection.connect():
-        _godot_connection = None
-        raise ConnectionError("Could not connect to Godot. Ensure the Godot Editor and MCP Bridge are running.")
-    
-    try:
-        # Verify the new connection works
-        _godot_connection.send_command("ping")
-        logger.info("Successfully established new Godot connection")
-        return _godot_connection
-    except Exception as e:
-        logger.error(f"Could not verify new connection: {str(e)}")
+            if conn.writer and not conn.is_alive():
+                logger.warning("Pooled Godot connection was closed, reconnecting")
+                await conn.aclose()
+            if not conn.writer:
+                if not await conn.connect():
+                    raise ConnectionError("Could not connect to Godot. Ensure the Godot Editor and MCP Bridge are running.")
+                # Verify the new connection works
+                await conn.send_raw(_PING_BYTES, "ping")
+            yield conn
+        except asyncio.CancelledError:
+            # The command may have been cut off mid-response, leaving the stream out of sync
+            await conn.aclose()
+            raise
+        finally:
+            self._pool.put_nowait(conn)
+
+    async def send_coalesced(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send an independent write, merged with others that arrive while one is in flight.
+
+        A write with nothing ahead of it is sent straight away. Writes issued while that
+        send is outstanding queue up and go to Godot together as a single BATCH once it
+        returns. Each caller still gets its own result or GodotCommandError.
+        """
+        if not config.coalesce_writes:
+            async with self.acquire() as conn:
+                return await conn.send_command(command_type, params)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending_writes.append((command_type, params, future))
+        if self._write_task is None:
+            self._write_task = asyncio.ensure_future(self._send_pending_writes())
+        return await future
+
+    async def _send_pending_writes(self) -> None:
+        """Send queued writes until the queue stays empty for the duration of a send."""
+        try:
+            while self._pending_writes:
+                pending, self._pending_writes = self._pending_writes, []
+                await self._flush_writes(pending)
+        except asyncio.CancelledError:
+            # Shutdown cancelled the sender; don't leave queued callers waiting forever
+            for _, _, future in self._pending_writes:
+                future.cancel()
+            self._pending_writes = []
+            raise
+        finally:
+            self._write_task = None
+
+    async def _flush_writes(self, pending: List[Tuple[str, Dict[str, Any], asyncio.Future]]) -> None:
+        """Send coalesced writes, as a plain command when only one arrived, and resolve their futures."""
+        commands = [(command_type, params) for command_type, params, _ in pending]
         try:
-            _godot_connection.disconnect()
-        except:
-            pass
-        _godot_connection = None
-        raise ConnectionError(f"Could not establish valid Godot connection: {str(e)}")
\ No newline at end of file
+            async with self.acquire() as conn:
+                if len(commands) == 1:
+                    results = [await conn.send_command(*commands[0])]
+                else:
+                    results = await conn.send_commands_batch(commands)
+        except asyncio.CancelledError:
+            # Shutdown cancelled the flush; don't leave callers waiting forever
+            for _, _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), result in zip(pending, results):
+            if future.done():
+                # The caller was cancelled while waiting
+                continue
+            if "error" in result:
+                future.set_exception(GodotCommandError(result["error"]))
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Close every connection currently idle in the pool."""
+        idle = []
+        while not self._pool.empty():
+            idle.append(self._pool.get_nowait())
+        for conn in idle:
+            await conn.aclose()
+            self._pool.put_nowait(conn)
+
+# Global Godot connection pool, created on first use
+_godot_connection_pool: GodotConnectionPool = None
+
+def get_godot_connection_pool() -> GodotConnectionPool:
+    """Retrieve or create the shared Godot connection pool."""
+    global _godot_connection_pool
+    if _godot_connection_pool is None:
+        _godot_connection_pool = GodotConnectionPool()
+    return _godot_connection_pool
+
+def acquire_godot_connection():
+    """Borrow a pooled Godot connection: async with acquire_godot_connection() as godot: ..."""
+    return get_godot_connection_pool().acquire()
+
+async def close_godot_connection_pool() -> None:
+    """Close the shared pool's connections, e.g. when the server shuts down.
+
+    The pool itself is kept, since tools hold on to it, and reconnects on next use.
+    """
+    if _godot_connection_pool is not None:
+        await _godot_connection_pool.close()
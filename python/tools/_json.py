@@ -0,0 +1,18 @@
+# tools/_json.py
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, fall back to the standard library
+    orjson = None
+
+# Parse JSON from bytes or str
+loads = orjson.loads if orjson is not None else json.loads
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize a tool result as JSON text indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
@@ -0,0 +1,37 @@
+# tools/_paths.py
+import posixpath
+from functools import lru_cache
+from typing import Optional, Tuple
+
+@lru_cache(maxsize=1024)
+def normalize_res_path(path: str, default_ext: Optional[str] = None, accepted_exts: Tuple[str, ...] = ()) -> str:
+    """Prefix a project path with res:// and append default_ext if it has none.
+
+    A path already ending in default_ext or one of accepted_exts is left as is.
+    Agents tend to repeat the same paths, so results are memoized.
+    """
+    if not path.startswith("res://"):
+        path = "res://" + path
+    if default_ext and not path.endswith((default_ext,) + accepted_exts):
+        path += default_ext
+    return path
+
+@lru_cache(maxsize=1024)
+def normalize_res_file_path(path: str, default_ext: str) -> str:
+    """Prefix a project path with res:// and append default_ext if its file name has no extension.
+
+    Unlike normalize_res_path, any existing extension is kept, so "player.cs" stays as is.
+    """
+    if not path.startswith("res://"):
+        path = "res://" + path
+    if "." not in path.rpartition("/")[2]:
+        path += default_ext
+    return path
+
+def res_path_extension(path: str) -> str:
+    """Return the lowercase extension of a project path without the dot, or "" if there is none."""
+    return posixpath.splitext(path)[1][1:].lower()
+
+def res_path_stem(path: str) -> str:
+    """Return the file name of a project path without its extension."""
+    return posixpath.splitext(posixpath.basename(path))[0]
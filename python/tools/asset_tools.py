@@ -1,18 +1,139 @@
 # tools/asset_tools.py
 from mcp.server.fastmcp import FastMCP, Context
-from typing import Optional, List
-from godot_connection import get_godot_connection
-import json
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+import asyncio
+import logging
+import time
+from config import config
+from godot_connection import get_godot_connection_pool, GodotCommandError
+from ._json import dumps_indented
+from ._paths import normalize_res_path, res_path_extension, res_path_stem
+
+logger = logging.getLogger("GodotMCP")
+
+# list_generated_meshes always sends the same query, so its params are built once;
+# Godot matches the extension itself, so only .glb files come back
+_GENERATED_MESHES_QUERY = {
+    "search_pattern": "*",
+    "extension": "glb",
+    "folder": "res://assets/generated_meshes/"
+}
+
+# GET_ASSET_LIST results by query, as (monotonic time fetched, assets)
+_asset_list_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+
+async def fetch_asset_list(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run a GET_ASSET_LIST query, reusing a result younger than config.asset_list_cache_ttl."""
+    key = tuple(sorted(params.items()))
+    now = time.monotonic()
+    cached = _asset_list_cache.get(key)
+    if cached is not None and now - cached[0] < config.asset_list_cache_ttl:
+        return cached[1]
+    
+    async with get_godot_connection_pool().acquire() as godot:
+        response = await godot.send_command("GET_ASSET_LIST", params)
+    assets = response.get("assets", [])
+    _asset_list_cache[key] = (now, assets)
+    return assets
+
+def invalidate_asset_list_cache() -> None:
+    """Drop cached asset listings after files were added to the project."""
+    _asset_list_cache.clear()
+
+# Listings the tools request with their default arguments, warmed at startup
+_PREFETCH_QUERIES = (
+    {"search_pattern": "*", "folder": "res://"},
+    {"type": "material", "folder": "res://materials"},
+    _GENERATED_MESHES_QUERY,
+)
+
+async def prefetch_asset_lists() -> None:
+    """Fetch the default asset listings so the first list tool call is served warm."""
+    results = await asyncio.gather(
+        *(fetch_asset_list(query) for query in _PREFETCH_QUERIES),
+        return_exceptions=True
+    )
+    for query, result in zip(_PREFETCH_QUERIES, results):
+        if isinstance(result, Exception):
+            logger.debug("Prefetching assets in %s failed: %s", query['folder'], result)
+
+async def import_model_into_scene(
+    model_path: str,
+    name: Optional[str] = None,
+    position: Sequence[float] = (0.0, 0.0, 0.0),
+    rotation: Sequence[float] = (0.0, 0.0, 0.0),
+    scale: Sequence[float] = (1.0, 1.0, 1.0)
+) -> str:
+    """Add a 3D model file to the current scene and describe the result.
+    
+    GLB/GLTF files are instanced as scenes; other formats, or a failed GLB import,
+    become a MeshInstance3D with the file as its mesh. Rotation is in degrees.
+    """
+    # Ensure model_path starts with res://
+    model_path = normalize_res_path(model_path)
+    
+    # Determine the name from the file if not provided
+    if not name:
+        name = res_path_stem(model_path)
+    
+    # Check file extension
+    extension = res_path_extension(model_path)
+    
+    async with get_godot_connection_pool().acquire() as godot:
+        if extension in ("glb", "gltf"):
+            # Use the specialized GLB import handler
+            try:
+                glb_response = await godot.send_command("IMPORT_GLB_SCENE", {
+                    "glb_path": model_path,
+                    "name": name,
+                    "position": position,
+                    "rotation": rotation,
+                    "scale": scale
+                })
+                instance_name = glb_response.get("instance_name", name)
+                return f"Successfully imported GLB model: {instance_name} at position ({position[0]}, {position[1]}, {position[2]})"
+            except GodotCommandError as e:
+                # If GLB import fails, try regular mesh approach
+                logger.warning("GLB import failed: %s, trying mesh approach...", e)
+    
+        # Create a MeshInstance3D node and set its mesh resource in one round-trip;
+        # the mesh is only set if the node was created
+        create_result, set_mesh_result = await godot.send_commands_batch([
+            ("CREATE_OBJECT", {
+                "type": "MeshInstance3D",
+                "name": name,
+                "location": position,
+                "rotation": rotation,
+                "scale": scale
+            }),
+            ("SET_PROPERTY", {
+                "node_name": name,
+                "property_name": "mesh",
+                "value": model_path
+            })
+        ], stop_on_error=True)
+    
+        if "error" in create_result:
+            return f"Failed to create MeshInstance3D: {create_result['error']}"
+    
+        if "error" in set_mesh_result:
+            # If setting mesh fails, the node is still created
+            return f"Created MeshInstance3D '{name}' but couldn't load mesh. You may need to manually assign the mesh from: {model_path}"
+    
+        return f"Successfully imported 3D model '{name}' from {model_path} at position ({position[0]}, {position[1]}, {position[2]})"
 
 def register_asset_tools(mcp: FastMCP):
     """Register all asset management tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    acquire_godot_connection = get_godot_connection_pool().acquire
     
     @mcp.tool()
-    def get_asset_list(
+    async def get_asset_list(
         ctx: Context,
         type: Optional[str] = None,
         search_pattern: str = "*",
-        folder: str = "res://"
+        folder: str = "res://",
+        limit: Optional[int] = None
     ) -> str:
         """List assets in the project.
         
@@ -21,14 +142,14 @@ def register_asset_tools(mcp: FastMCP):
             type: Optional asset type to filter by (e.g., "scene", "script", "texture")
             search_pattern: Pattern to match in asset names
             folder: Folder path to search in
+            limit: Optional maximum number of assets to return
             
         Returns:
             str: JSON string with list of found assets or error details
         """
         try:
             # Ensure folder starts with res://
-            if not folder.startswith("res://"):
-                folder = "res://" + folder
+            folder = normalize_res_path(folder)
             
             params = {
                 "search_pattern": search_pattern,
@@ -37,22 +158,22 @@ def register_asset_tools(mcp: FastMCP):
             
             if type:
                 params["type"] = type
+            if limit:
+                # Truncate in Godot so unused records are never sent
+                params["limit"] = limit
                 
-            response = get_godot_connection().send_command("GET_ASSET_LIST", params)
-            assets = response.get("assets", [])
+            assets = await fetch_asset_list(params)
             
             if not assets:
-                if type:
-                    return f"No {type} assets found in {folder} matching '{search_pattern}'"
-                else:
-                    return f"No assets found in {folder} matching '{search_pattern}'"
+                qualifier = f"{type} " if type else ""
+                return f"No {qualifier}assets found in {folder} matching '{search_pattern}'"
                     
-            return json.dumps(assets, indent=2)
+            return dumps_indented(assets)
         except Exception as e:
             return f"Error listing assets: {str(e)}"
             
     @mcp.tool()
-    def import_asset(
+    async def import_asset(
         ctx: Context,
         source_path: str,
         target_path: str,
@@ -71,21 +192,22 @@ def register_asset_tools(mcp: FastMCP):
         """
         try:
             # Ensure target_path starts with res://
-            if not target_path.startswith("res://"):
-                target_path = "res://" + target_path
+            target_path = normalize_res_path(target_path)
             
-            response = get_godot_connection().send_command("IMPORT_ASSET", {
-                "source_path": source_path,
-                "target_path": target_path,
-                "overwrite": overwrite
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("IMPORT_ASSET", {
+                    "source_path": source_path,
+                    "target_path": target_path,
+                    "overwrite": overwrite
+                })
+            invalidate_asset_list_cache()
             
             return response.get("message", "Asset imported successfully")
         except Exception as e:
             return f"Error importing asset: {str(e)}"
             
     @mcp.tool()
-    def create_prefab(
+    async def create_prefab(
         ctx: Context,
         object_name: str,
         prefab_path: str,
@@ -103,29 +225,24 @@ def register_asset_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Ensure prefab_path starts with res://
-            if not prefab_path.startswith("res://"):
-                prefab_path = "res://" + prefab_path
-                
-            # Ensure it has .tscn extension
-            if not prefab_path.endswith(".tscn"):
-                prefab_path += ".tscn"
-            
-            response = get_godot_connection().send_command("CREATE_PREFAB", {
-                "object_name": object_name,
-                "prefab_path": prefab_path,
-                "overwrite": overwrite
-            })
+            # Ensure prefab_path starts with res:// and has a .tscn extension
+            prefab_path = normalize_res_path(prefab_path, ".tscn")
+            
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("CREATE_PREFAB", {
+                    "object_name": object_name,
+                    "prefab_path": prefab_path,
+                    "overwrite": overwrite
+                })
+            invalidate_asset_list_cache()
             
-            if response.get("success", False):
-                return f"Packed scene created successfully at {response.get('path', prefab_path)}"
-            else:
-                return f"Error creating packed scene: {response.get('error', 'Unknown error')}"
+            # Failures raise GodotCommandError, so a response here is a success
+            return f"Packed scene created successfully at {response.get('path', prefab_path)}"
         except Exception as e:
             return f"Error creating packed scene: {str(e)}"
             
     @mcp.tool()
-    def instantiate_prefab(
+    async def instantiate_prefab(
         ctx: Context,
         prefab_path: str,
         position_x: float = 0.0,
@@ -151,33 +268,27 @@ def register_asset_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Ensure prefab_path starts with res://
-            if not prefab_path.startswith("res://"):
-                prefab_path = "res://" + prefab_path
-                
-            # Ensure it has .tscn extension
-            if not prefab_path.endswith(".tscn") and not prefab_path.endswith(".scn"):
-                prefab_path += ".tscn"
-            
-            response = get_godot_connection().send_command("INSTANTIATE_PREFAB", {
-                "prefab_path": prefab_path,
-                "position_x": position_x,
-                "position_y": position_y,
-                "position_z": position_z,
-                "rotation_x": rotation_x,
-                "rotation_y": rotation_y,
-                "rotation_z": rotation_z
-            })
+            # Ensure prefab_path starts with res:// and has a .tscn or .scn extension
+            prefab_path = normalize_res_path(prefab_path, ".tscn", (".scn",))
+            
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("INSTANTIATE_PREFAB", {
+                    "prefab_path": prefab_path,
+                    "position_x": position_x,
+                    "position_y": position_y,
+                    "position_z": position_z,
+                    "rotation_x": rotation_x,
+                    "rotation_y": rotation_y,
+                    "rotation_z": rotation_z
+                })
             
-            if response.get("success", False):
-                return f"Packed scene instantiated as {response.get('instance_name', 'unknown')}"
-            else:
-                return f"Error instantiating packed scene: {response.get('error', 'Unknown error')}"
+            # Failures raise GodotCommandError, so a response here is a success
+            return f"Packed scene instantiated as {response.get('instance_name', 'unknown')}"
         except Exception as e:
             return f"Error instantiating packed scene: {str(e)}"
     
     @mcp.tool()
-    def import_3d_model(
+    async def import_3d_model(
         ctx: Context,
         model_path: str,
         name: str = None,
@@ -214,69 +325,105 @@ def register_asset_tools(mcp: FastMCP):
             str: Success message with node details or error
         """
         try:
-            # Ensure model_path starts with res://
-            if not model_path.startswith("res://"):
-                model_path = "res://" + model_path
-            
-            # Determine the name from the file if not provided
-            if not name:
-                # Extract filename without extension
-                filename = model_path.split('/')[-1]
-                name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-            
-            # Check file extension
-            extension = model_path.split('.')[-1].lower() if '.' in model_path else ""
+            return await import_model_into_scene(
+                model_path,
+                name,
+                [position_x, position_y, position_z],
+                [rotation_x, rotation_y, rotation_z],
+                [scale_x, scale_y, scale_z]
+            )
+        except Exception as e:
+            return f"Error importing 3D model: {str(e)}"
+    
+    @mcp.tool()
+    async def import_3d_models_batch(
+        ctx: Context,
+        models: List[Dict[str, Any]]
+    ) -> str:
+        """Import several 3D model files (GLB, FBX, OBJ) into the current scene in one request.
+        
+        Much faster than calling import_3d_model once per model, e.g. after generating
+        several meshes with Meshy.
+        
+        Args:
+            ctx: The MCP context
+            models: Models to import. Each is a dict with "model_path" and optional "name",
+                "position" [x, y, z], "rotation" [x, y, z] in degrees and "scale" [x, y, z]
             
-            if extension == "glb" or extension == "gltf":
-                # Use the specialized GLB import handler
-                glb_response = get_godot_connection().send_command("IMPORT_GLB_SCENE", {
-                    "glb_path": model_path,
-                    "name": name,
-                    "position": [position_x, position_y, position_z],
-                    "rotation": [rotation_x, rotation_y, rotation_z],
-                    "scale": [scale_x, scale_y, scale_z]
-                })
+        Returns:
+            str: One line per model with its result
+        """
+        try:
+            if not models:
+                return "Error: No models to import"
+            
+            commands = []
+            names = []
+            for model in models:
+                if not model.get("model_path"):
+                    return "Error: Every model needs a model_path"
+                model_path = normalize_res_path(model["model_path"])
+                name = model.get("name") or res_path_stem(model_path)
+                position = model.get("position") or [0.0, 0.0, 0.0]
+                rotation = model.get("rotation") or [0.0, 0.0, 0.0]
+                scale = model.get("scale") or [1.0, 1.0, 1.0]
                 
-                if glb_response.get("success", False):
-                    instance_name = glb_response.get("instance_name", name)
-                    return f"Successfully imported GLB model: {instance_name} at position ({position_x}, {position_y}, {position_z})"
-                elif "error" in glb_response:
-                    # If GLB import fails, try regular mesh approach
-                    print(f"GLB import failed: {glb_response['error']}, trying mesh approach...")
+                if res_path_extension(model_path) in ("glb", "gltf"):
+                    commands.append(("IMPORT_GLB_SCENE", {
+                        "glb_path": model_path,
+                        "name": name,
+                        "position": position,
+                        "rotation": rotation,
+                        "scale": scale
+                    }))
                 else:
-                    # Continue to mesh approach
-                    pass
-            
-            # Create a MeshInstance3D node
-            create_response = get_godot_connection().send_command("CREATE_OBJECT", {
-                "type": "MeshInstance3D",
-                "name": name,
-                "location": [position_x, position_y, position_z],
-                "rotation": [rotation_x, rotation_y, rotation_z],
-                "scale": [scale_x, scale_y, scale_z]
-            })
-            
-            if "error" in create_response:
-                return f"Failed to create MeshInstance3D: {create_response['error']}"
-            
-            # Try to set the mesh resource
-            set_mesh_response = get_godot_connection().send_command("SET_PROPERTY", {
-                "node_name": name,
-                "property_name": "mesh",
-                "value": model_path
-            })
-            
-            if "error" in set_mesh_response:
-                # If setting mesh fails, the node is still created
-                return f"Created MeshInstance3D '{name}' but couldn't load mesh. You may need to manually assign the mesh from: {model_path}"
-            
-            return f"Successfully imported 3D model '{name}' from {model_path} at position ({position_x}, {position_y}, {position_z})"
+                    # Nested batch: the mesh is only set if the node was created
+                    commands.append(("BATCH", {
+                        "commands": [
+                            {"type": "CREATE_OBJECT", "params": {
+                                "type": "MeshInstance3D",
+                                "name": name,
+                                "location": position,
+                                "rotation": rotation,
+                                "scale": scale
+                            }},
+                            {"type": "SET_PROPERTY", "params": {
+                                "node_name": name,
+                                "property_name": "mesh",
+                                "value": model_path
+                            }}
+                        ],
+                        "stop_on_error": True
+                    }))
+                names.append(name)
+            
+            async with acquire_godot_connection() as godot:
+                results = await godot.send_commands_batch(commands)
+            
+            lines = []
+            imported = 0
+            for name, result in zip(names, results):
+                if "error" in result:
+                    lines.append(f"• {name}: Error: {result['error']}")
+                elif "results" in result:
+                    create_response, set_mesh_response = result["results"]
+                    if create_response.get("status") == "error":
+                        lines.append(f"• {name}: Failed to create MeshInstance3D: {create_response.get('error')}")
+                    elif set_mesh_response.get("status") == "error":
+                        lines.append(f"• {name}: Created MeshInstance3D but couldn't load mesh")
+                    else:
+                        imported += 1
+                        lines.append(f"• {name}: Imported as MeshInstance3D")
+                else:
+                    imported += 1
+                    lines.append(f"• {name}: Imported as {result.get('instance_name', name)}")
             
+            return f"Imported {imported} of {len(names)} model(s):\n" + "\n".join(lines)
         except Exception as e:
-            return f"Error importing 3D model: {str(e)}"
+            return f"Error importing 3D models: {str(e)}"
     
     @mcp.tool()
-    def list_generated_meshes(ctx: Context) -> str:
+    async def list_generated_meshes(ctx: Context) -> str:
         """List all generated mesh files in the res://assets/generated_meshes/ folder.
         
         This is a convenience tool specifically for listing Meshy-generated models.
@@ -288,28 +435,20 @@ def register_asset_tools(mcp: FastMCP):
             str: List of generated mesh files or error message
         """
         try:
-            response = get_godot_connection().send_command("GET_ASSET_LIST", {
-                "search_pattern": ".glb",
-                "folder": "res://assets/generated_meshes/"
-            })
-            
-            assets = response.get("assets", [])
+            assets = await fetch_asset_list(_GENERATED_MESHES_QUERY)
             
             if not assets:
                 return "No generated meshes found. Generate some meshes using generate_mesh_from_text first!"
             
-            # Format the output nicely
-            result = "**Generated Meshes Available:**\n\n"
-            glb_files = [asset for asset in assets if asset['name'].endswith('.glb')]
-            
-            for asset in glb_files:
-                name = asset['name'].replace('.glb', '')
-                result += f"• **{name}** - `{asset['path']}`\n"
-            
-            result += f"\n**Total:** {len(glb_files)} mesh(es)\n"
-            result += "\nUse `import_3d_model` to add any of these to your scene!"
+            # Format the output nicely, dropping the .glb suffix from each name
+            lines = [f"• **{asset['name'][:-4]}** - `{asset['path']}`\n" for asset in assets]
             
-            return result
+            return (
+                "**Generated Meshes Available:**\n\n"
+                + "".join(lines)
+                + f"\n**Total:** {len(lines)} mesh(es)\n"
+                + "\nUse `import_3d_model` to add any of these to your scene!"
+            )
             
         except Exception as e:
             return f"Error listing generated meshes: {str(e)}"
\ No newline at end of file
@@ -1,13 +1,36 @@
 # tools/editor_tools.py
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Optional
-from godot_connection import get_godot_connection
+import json
+from godot_connection import get_godot_connection_pool
+
+# Accepted values, in the order they are listed in error messages
+_VALID_EDITOR_COMMANDS = ("PLAY", "STOP", "SAVE")
+_VALID_MESSAGE_TYPES = ("INFO", "WARNING", "ERROR")
+
+# The editor commands never change, so each request is serialized once
+_EDITOR_COMMAND_PAYLOADS = {
+    command: json.dumps({"type": "EDITOR_CONTROL", "params": {"command": command}}).encode('utf-8')
+    for command in _VALID_EDITOR_COMMANDS
+}
 
 def register_editor_tools(mcp: FastMCP):
     """Register all editor control tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    acquire_godot_connection = get_godot_connection_pool().acquire
+    
+    async def _send_editor_command(command: str) -> str:
+        """Send one of the validated EDITOR_CONTROL commands to Godot."""
+        try:
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_raw(_EDITOR_COMMAND_PAYLOADS[command], "EDITOR_CONTROL")
+            
+            return response.get("message", f"Editor command '{command}' executed")
+        except Exception as e:
+            return f"Error executing editor command: {str(e)}"
     
     @mcp.tool()
-    def editor_action(ctx: Context, command: str) -> str:
+    async def editor_action(ctx: Context, command: str) -> str:
         """Execute an editor command like play, stop, or save.
         
         Args:
@@ -17,22 +40,14 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             str: Success message or error details
         """
-        try:
-            # Validate command
-            valid_commands = ["PLAY", "STOP", "SAVE"]
-            if command.upper() not in valid_commands:
-                return f"Error: Invalid command '{command}'. Valid commands are {', '.join(valid_commands)}"
-            
-            response = get_godot_connection().send_command("EDITOR_CONTROL", {
-                "command": command.upper()
-            })
-            
-            return response.get("message", f"Editor command '{command}' executed")
-        except Exception as e:
-            return f"Error executing editor command: {str(e)}"
+        # Validate command
+        if command.upper() not in _VALID_EDITOR_COMMANDS:
+            return f"Error: Invalid command '{command}'. Valid commands are {', '.join(_VALID_EDITOR_COMMANDS)}"
+        
+        return await _send_editor_command(command.upper())
             
     @mcp.tool()
-    def show_message(
+    async def show_message(
         ctx: Context,
         title: str,
         message: str,
@@ -51,25 +66,25 @@ def register_editor_tools(mcp: FastMCP):
         """
         try:
             # Validate message type
-            valid_types = ["INFO", "WARNING", "ERROR"]
-            if type.upper() not in valid_types:
-                return f"Error: Invalid message type '{type}'. Valid types are {', '.join(valid_types)}"
+            if type.upper() not in _VALID_MESSAGE_TYPES:
+                return f"Error: Invalid message type '{type}'. Valid types are {', '.join(_VALID_MESSAGE_TYPES)}"
             
-            response = get_godot_connection().send_command("EDITOR_CONTROL", {
-                "command": "SHOW_MESSAGE",
-                "params": {
-                    "title": title,
-                    "message": message,
-                    "type": type.upper()
-                }
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("EDITOR_CONTROL", {
+                    "command": "SHOW_MESSAGE",
+                    "params": {
+                        "title": title,
+                        "message": message,
+                        "type": type.upper()
+                    }
+                })
             
             return response.get("message", "Message shown in editor")
         except Exception as e:
             return f"Error showing message: {str(e)}"
 
     @mcp.tool()
-    def play_scene(ctx: Context) -> str:
+    async def play_scene(ctx: Context) -> str:
         """Start playing the current scene in the editor.
         
         Args:
@@ -78,10 +93,10 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             str: Success message or error details
         """
-        return editor_action(ctx, "PLAY")
+        return await _send_editor_command("PLAY")
         
     @mcp.tool()
-    def stop_scene(ctx: Context) -> str:
+    async def stop_scene(ctx: Context) -> str:
         """Stop playing the current scene in the editor.
         
         Args:
@@ -90,10 +105,10 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             str: Success message or error details
         """
-        return editor_action(ctx, "STOP")
+        return await _send_editor_command("STOP")
         
     @mcp.tool()
-    def save_all(ctx: Context) -> str:
+    async def save_all(ctx: Context) -> str:
         """Save all open resources in the editor.
         
         Args:
@@ -102,4 +117,4 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             str: Success message or error details
         """
-        return editor_action(ctx, "SAVE")
\ No newline at end of file
+        return await _send_editor_command("SAVE")
\ No newline at end of file
@@ -1,13 +1,16 @@
 # tools/material_tools.py
 from mcp.server.fastmcp import FastMCP, Context
 from typing import List, Optional
-from godot_connection import get_godot_connection
+from godot_connection import get_godot_connection_pool
+from .asset_tools import fetch_asset_list, invalidate_asset_list_cache
 
 def register_material_tools(mcp: FastMCP):
     """Register all material-related tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    acquire_godot_connection = get_godot_connection_pool().acquire
     
     @mcp.tool()
-    def set_material(
+    async def set_material(
         ctx: Context,
         object_name: str,
         material_name: Optional[str] = None,
@@ -37,23 +40,26 @@ def register_material_tools(mcp: FastMCP):
                 
             if color:
                 # Validate color array
-                if len(color) < 3 or len(color) > 4:
+                if not 3 <= len(color) <= 4:
                     return "Error: Color must be [r, g, b] or [r, g, b, a]"
                     
                 # Ensure all values are in 0.0-1.0 range
-                for value in color:
-                    if value < 0.0 or value > 1.0:
-                        return "Error: Color values must be in range 0.0-1.0"
+                if min(color) < 0.0 or max(color) > 1.0:
+                    return "Error: Color values must be in range 0.0-1.0"
                         
                 params["color"] = color
             
-            response = get_godot_connection().send_command("SET_MATERIAL", params)
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("SET_MATERIAL", params)
+            if material_name:
+                # A named material is saved as a new file under res://materials
+                invalidate_asset_list_cache()
             return response.get("message", "Material applied successfully")
         except Exception as e:
             return f"Error setting material: {str(e)}"
             
     @mcp.tool()
-    def list_materials(ctx: Context, folder_path: str = "res://materials") -> str:
+    async def list_materials(ctx: Context, folder_path: str = "res://materials") -> str:
         """List all material files in a specified folder.
         
         Args:
@@ -65,12 +71,10 @@ def register_material_tools(mcp: FastMCP):
         """
         try:
             # Use asset list command with material type filter
-            response = get_godot_connection().send_command("GET_ASSET_LIST", {
+            materials = await fetch_asset_list({
                 "type": "material",
                 "folder": folder_path
             })
-            
-            materials = response.get("assets", [])
             if not materials:
                 return f"No materials found in {folder_path}"
                 
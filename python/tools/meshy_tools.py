@@ -1,22 +1,291 @@
 # tools/meshy_tools.py
 from mcp.server.fastmcp import FastMCP, Context
-from typing import Optional, Dict, Any
-import requests
+from typing import Optional, Dict, List, Any, AsyncIterator, Awaitable, Callable, Set, Tuple
+from functools import wraps
+import asyncio
+import base64
+import hashlib
+import httpx
 import json
 import time
 import os
-import urllib.request
+import posixpath
+import re
+import tempfile
 import logging
+import mimetypes
+from urllib.parse import urlsplit
 from config import config
-from godot_connection import get_godot_connection
+from godot_connection import acquire_godot_connection, GodotCommandError
+from .asset_tools import invalidate_asset_list_cache, import_model_into_scene
+from ._json import loads
 
 logger = logging.getLogger("GodotMCP")
 
+# Status payloads of text-to-3D tasks that reached a final state, by task ID;
+# a finished task never changes, so it doesn't need to be fetched again
+_FINAL_TASK_STATUSES = ("SUCCEEDED", "FAILED")
+_task_status_cache: Dict[str, Dict[str, Any]] = {}
+
+# Model formats that can be downloaded into the project
+_MESH_EXTENSIONS = frozenset((".glb", ".fbx", ".obj"))
+
+# Characters dropped from mesh names to build portable file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9 _\-]+")
+
+# Import directories known to exist in the project, so each download doesn't re-check
+_ensured_directories: Set[str] = set()
+
+# Preview generations in flight, by (prompt, art_style, negative_prompt, should_remesh);
+# a Meshy task is billed per request, so identical concurrent requests share one
+_inflight_previews: Dict[Tuple[str, str, str, bool], "asyncio.Future[Tuple[str, Optional[str]]]"] = {}
+
+def _image_data_uri(path: str) -> str:
+    """Read a local PNG or JPEG image as a base64 data URI for the image-to-3D endpoint."""
+    mime_type, _ = mimetypes.guess_type(path)
+    if mime_type not in ("image/png", "image/jpeg"):
+        raise ValueError(f"Unsupported image format for {path}; use a PNG or JPEG file")
+    with open(path, "rb") as image_file:
+        encoded = base64.b64encode(image_file.read()).decode("ascii")
+    return f"data:{mime_type};base64,{encoded}"
+
+def _requires_meshy_key(tool: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Make a Meshy tool answer with setup instructions while no API key is configured."""
+    @wraps(tool)
+    async def wrapper(*args, **kwargs) -> str:
+        if not config.meshy_api_key:
+            return "Error: MESHY_API_KEY environment variable not set. Please set your Meshy API key or use the test key: msy_dummy_api_key_for_test_mode_12345678"
+        return await tool(*args, **kwargs)
+    return wrapper
+
+# Shared Meshy API client and the API key it was built for
+_client: Optional[httpx.AsyncClient] = None
+_client_key: Optional[str] = None
+
+async def _meshy_client() -> httpx.AsyncClient:
+    """Shared Meshy API client, rebuilt (closing the old one) if MESHY_API_KEY changes."""
+    global _client, _client_key
+    api_key = config.meshy_api_key
+    if _client is not None and _client_key == api_key:
+        return _client
+    
+    old_client = _client
+    _client = httpx.AsyncClient(
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        },
+        timeout=30,
+        # Keep-alive connections let polls skip the TCP and TLS handshakes;
+        # the transport retries requests that failed to connect
+        transport=httpx.AsyncHTTPTransport(
+            retries=config.max_retries,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=4)
+        )
+    )
+    _client_key = api_key
+    if old_client is not None:
+        await old_client.aclose()
+    return _client
+
+async def close_meshy_client() -> None:
+    """Close the shared HTTP client if one was created."""
+    global _client, _client_key
+    if _client is not None:
+        client, _client, _client_key = _client, None, None
+        await client.aclose()
+
+async def _poll_with_backoff(
+    url: str,
+    max_wait_time: float,
+    initial: float = 2.0,
+    base: float = 1.3,
+    cap: float = 30.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """Poll a Meshy task URL, yielding each status payload until max_wait_time has passed.
+    
+    The wait between polls grows from `initial` by a factor of `base` up to `cap`, so
+    short tasks are seen finishing quickly without hammering the API on long ones.
+    Rate limiting (429) and server errors (5xx) are retried after Retry-After, if given.
+    """
+    client = await _meshy_client()
+    deadline = time.monotonic() + max_wait_time
+    attempt = 0
+    while True:
+        response = await client.get(url)
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else initial
+            # Start the schedule over once the API has recovered
+            attempt = 0
+            logger.info("Meshy API returned %s, retrying in %s seconds", response.status_code, delay)
+        else:
+            response.raise_for_status()
+            yield loads(response.content)
+            delay = min(cap, initial * base ** attempt)
+            attempt += 1
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(delay, remaining))
+
+async def _wait_for_task(
+    endpoint: str,
+    task_id: str,
+    max_wait_time: float,
+    label: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """Poll a Meshy task until it finishes and pick the model to download.
+    
+    Args:
+        endpoint: API endpoint the task was created on, e.g. "text-to-3d"
+        task_id: ID of the task to wait for
+        max_wait_time: Seconds to wait before giving up
+        label: What the task does, used in log and error messages
+        
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Download URL of the model, or an error message
+    """
+    async for status_data in _poll_with_backoff(
+        f"{config.meshy_base_url}/v2/{endpoint}/{task_id}",
+        max_wait_time
+    ):
+        status = status_data.get("status")
+        progress = status_data.get("progress", 0)
+        
+        logger.info("%s status: %s | Progress: %s%%", label, status, progress)
+        
+        if status == "SUCCEEDED":
+            model_urls = status_data.get("model_urls", {})
+            
+            if not model_urls:
+                return None, "Error: No model URLs in completed task"
+            
+            # Prefer GLB format for Godot (matches documentation example)
+            download_url = model_urls.get("glb") or model_urls.get("fbx") or model_urls.get("obj")
+            
+            if not download_url:
+                return None, f"Error: No supported model format found. Available formats: {list(model_urls.keys())}"
+            
+            logger.info("%s completed! Download URL: %s", label, download_url)
+            return download_url, None
+        
+        elif status == "FAILED":
+            error_msg = status_data.get("task_error", {}).get("message", "Unknown error")
+            return None, f"{label} failed: {error_msg}"
+        
+        elif status not in ["PENDING", "IN_PROGRESS"]:
+            return None, f"Unknown task status: {status}"
+    
+    return None, f"{label} timeout after {max_wait_time} seconds"
+
+async def _generate_preview_mesh(
+    prompt: str,
+    art_style: str,
+    negative_prompt: str,
+    should_remesh: bool
+) -> Tuple[str, Optional[str]]:
+    """Run a text-to-3D preview task to completion.
+    
+    Returns:
+        Tuple[str, Optional[str]]: Result message, and the model download URL if the task succeeded
+    """
+    # Step 1: Create text-to-3D task
+    logger.info("Starting mesh generation for prompt: %s", prompt)
+    
+    # Prepare the generation request - Matches official Meshy API v2 format exactly
+    generation_data = {
+        "mode": "preview",  # Start with preview mode
+        "prompt": prompt,
+        "art_style": art_style,
+        "should_remesh": should_remesh
+    }
+    
+    # Add negative_prompt only if provided (optional parameter)
+    if negative_prompt.strip():
+        generation_data["negative_prompt"] = negative_prompt
+    
+    # Create the generation task - Official v2 endpoint
+    client = await _meshy_client()
+    response = await client.post(
+        f"{config.meshy_base_url}/v2/text-to-3d",
+        json=generation_data
+    )
+    
+    # Handle response according to official documentation
+    response.raise_for_status()
+    
+    task_data = loads(response.content)
+    task_id = task_data.get("result")
+    
+    if not task_id:
+        return f"Error: No task ID returned from Meshy API. Response: {task_data}", None
+    
+    logger.info("Preview task created. Task ID: %s", task_id)
+    
+    # Step 2: Poll for completion - matches official polling pattern
+    logger.info("Waiting for mesh generation to complete...")
+    
+    download_url, error = await _wait_for_task(
+        "text-to-3d", task_id, config.meshy_timeout, "Mesh generation"
+    )
+    if error:
+        return error, None
+    
+    # Store task_id for potential refinement
+    result_message = f"Preview mesh generated successfully! Task ID: {task_id}\n"
+    result_message += f"Download URL: {download_url}\n"
+    result_message += f"Use refine_generated_mesh('{task_id}') to create a high-quality textured version."
+    return result_message, download_url
+
+async def _generate_preview_mesh_once(
+    prompt: str,
+    art_style: str,
+    negative_prompt: str,
+    should_remesh: bool
+) -> Tuple[str, Optional[str]]:
+    """Run _generate_preview_mesh, sharing one Meshy task between identical concurrent requests."""
+    key = (prompt, art_style, negative_prompt, should_remesh)
+    task = _inflight_previews.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_preview_mesh(*key))
+        _inflight_previews[key] = task
+        task.add_done_callback(lambda _: _inflight_previews.pop(key, None))
+    # Shielded so one caller giving up doesn't cancel the task for the others
+    return await asyncio.shield(task)
+
+async def _generate_and_import_mesh(
+    prompt: str,
+    name: Optional[str],
+    art_style: str,
+    negative_prompt: str,
+    should_remesh: bool,
+    import_to_godot: bool
+) -> str:
+    """Generate a preview mesh from text and optionally import it, returning the tool message."""
+    try:
+        message, download_url = await _generate_preview_mesh_once(
+            prompt, art_style, negative_prompt, should_remesh
+        )
+        
+        # Step 3: Download the mesh file
+        if download_url and import_to_godot:
+            download_result, _ = await _download_mesh_to_project(download_url, name)
+            return f"{message}\n\n{download_result}"
+        return message
+        
+    except httpx.HTTPError as e:
+        return f"Network error communicating with Meshy API: {str(e)}"
+    except Exception as e:
+        return f"Error generating mesh: {str(e)}"
+
 def register_meshy_tools(mcp: FastMCP):
     """Register Meshy API tools with the MCP server."""
     
     @mcp.tool()
-    def generate_mesh_from_text(
+    @_requires_meshy_key
+    async def generate_mesh_from_text(
         ctx: Context,
         prompt: str,
         name: str = None,
@@ -50,125 +319,64 @@ def register_meshy_tools(mcp: FastMCP):
         Returns:
             str: Success message with details or error information
         """
-        try:
-            if not config.meshy_api_key:
-                return "Error: MESHY_API_KEY environment variable not set. Please set your Meshy API key or use the test key: msy_dummy_api_key_for_test_mode_12345678"
-            
-            # Step 1: Create text-to-3D task
-            logger.info(f"Starting mesh generation for prompt: {prompt}")
-            
-            headers = {
-                "Authorization": f"Bearer {config.meshy_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Prepare the generation request - Matches official Meshy API v2 format exactly
-            generation_data = {
-                "mode": "preview",  # Start with preview mode
-                "prompt": prompt,
-                "art_style": art_style,
-                "should_remesh": should_remesh
-            }
-            
-            # Add negative_prompt only if provided (optional parameter)
-            if negative_prompt.strip():
-                generation_data["negative_prompt"] = negative_prompt
+        return await _generate_and_import_mesh(
+            prompt, name, art_style, negative_prompt, should_remesh, import_to_godot
+        )
+    
+    @mcp.tool()
+    @_requires_meshy_key
+    async def generate_meshes_from_texts(
+        ctx: Context,
+        prompts: List[str],
+        names: List[str] = None,
+        art_style: str = "realistic",
+        negative_prompt: str = "",
+        should_remesh: bool = True,
+        import_to_godot: bool = True
+    ) -> str:
+        """Generate several 3D meshes from text descriptions at once and optionally import them into Godot.
+        
+        ⚠️ IMPORTANT: This generates PREVIEW quality meshes, one Meshy task per prompt.
+        ⚠️ DO NOT automatically refine unless explicitly requested by the user!
+        
+        The generations run concurrently, so this takes about as long as the slowest one
+        instead of the sum of all of them.
+        
+        Args:
+            ctx: The MCP context
+            prompts: Text descriptions of the 3D models to generate
+            names: Optional names for the generated meshes, one per prompt
+            art_style: Art style for all generations ("realistic", "cartoon", "low-poly", "sculpture")
+            negative_prompt: What to avoid in the generations
+            should_remesh: Whether to apply remeshing for better topology (recommended: True)
+            import_to_godot: Whether to automatically import the meshes into Godot
             
-            # Create the generation task - Official v2 endpoint
-            response = requests.post(
-                f"{config.meshy_base_url}/v2/text-to-3d",
-                headers=headers,
-                json=generation_data,
-                timeout=30
+        Returns:
+            str: Result of each generation, in prompt order
+        """
+        if not prompts:
+            return "Error: No prompts given"
+        if names and len(names) != len(prompts):
+            return f"Error: Got {len(names)} names for {len(prompts)} prompts"
+        
+        if not names:
+            # Meshes generated in the same second would otherwise share a default file name
+            timestamp = int(time.time())
+            names = [f"GeneratedMesh_{timestamp}_{index}" for index in range(1, len(prompts) + 1)]
+        
+        results = await asyncio.gather(*(
+            _generate_and_import_mesh(
+                prompt, name, art_style, negative_prompt, should_remesh, import_to_godot
             )
-            
-            # Handle response according to official documentation
-            response.raise_for_status()
-            
-            task_data = response.json()
-            task_id = task_data.get("result")
-            
-            if not task_id:
-                return f"Error: No task ID returned from Meshy API. Response: {task_data}"
-            
-            logger.info(f"Preview task created. Task ID: {task_id}")
-            
-            # Step 2: Poll for completion - matches official polling pattern
-            logger.info("Waiting for mesh generation to complete...")
-            
-            max_wait_time = config.meshy_timeout
-            check_interval = 5  # Check every 5 seconds (matches documentation example)
-            elapsed_time = 0
-            
-            while elapsed_time < max_wait_time:
-                # Check task status - Official v2 endpoint
-                status_response = requests.get(
-                    f"{config.meshy_base_url}/v2/text-to-3d/{task_id}",
-                    headers=headers,
-                    timeout=30
-                )
-                
-                status_response.raise_for_status()
-                
-                status_data = status_response.json()
-                status = status_data.get("status")
-                progress = status_data.get("progress", 0)
-                
-                logger.info(f"Preview task status: {status} | Progress: {progress}%")
-                
-                if status == "SUCCEEDED":
-                    logger.info("Preview task finished.")
-                    
-                    # Generation completed successfully
-                    model_urls = status_data.get("model_urls", {})
-                    
-                    if not model_urls:
-                        return "Error: No model URLs in completed task"
-                    
-                    # Prefer GLB format for Godot (matches documentation example)
-                    download_url = model_urls.get("glb") or model_urls.get("fbx") or model_urls.get("obj")
-                    
-                    if not download_url:
-                        return f"Error: No supported model format found. Available formats: {list(model_urls.keys())}"
-                    
-                    logger.info(f"Preview model completed! Download URL: {download_url}")
-                    
-                    # Store task_id for potential refinement
-                    result_message = f"Preview mesh generated successfully! Task ID: {task_id}\n"
-                    result_message += f"Download URL: {download_url}\n"
-                    result_message += f"Use refine_generated_mesh('{task_id}') to create a high-quality textured version."
-                    
-                    # Step 3: Download the mesh file
-                    if import_to_godot:
-                        download_result = _download_mesh_to_project(download_url, name)
-                        if "Error" in download_result:
-                            return f"{result_message}\n\n{download_result}"
-                        else:
-                            return f"{result_message}\n\n{download_result}"
-                    else:
-                        return result_message
-                
-                elif status == "FAILED":
-                    error_msg = status_data.get("task_error", {}).get("message", "Unknown error")
-                    return f"Mesh generation failed: {error_msg}"
-                
-                elif status in ["PENDING", "IN_PROGRESS"]:
-                    # Still processing, wait and check again (matches documentation pattern)
-                    logger.info(f"Preview task status: {status} | Progress: {progress} | Retrying in {check_interval} seconds...")
-                    time.sleep(check_interval)
-                    elapsed_time += check_interval
-                else:
-                    return f"Unknown task status: {status}"
-            
-            return f"Mesh generation timeout after {max_wait_time} seconds"
-            
-        except requests.exceptions.RequestException as e:
-            return f"Network error communicating with Meshy API: {str(e)}"
-        except Exception as e:
-            return f"Error generating mesh: {str(e)}"
+            for prompt, name in zip(prompts, names)
+        ))
+        return "\n\n".join(
+            f"**{prompt}**\n{result}" for prompt, result in zip(prompts, results)
+        )
     
     @mcp.tool()
-    def generate_mesh_from_image(
+    @_requires_meshy_key
+    async def generate_mesh_from_image(
         ctx: Context,
         image_url: str,
         name: str = None,
@@ -182,7 +390,7 @@ def register_meshy_tools(mcp: FastMCP):
         
         Args:
             ctx: The MCP context
-            image_url: URL or path to the image to convert to 3D
+            image_url: URL of the image to convert to 3D, or the path of a local PNG/JPEG file
             name: Optional name for the generated mesh object in Godot
             import_to_godot: Whether to automatically import the mesh into Godot scene
             position: Optional [x, y, z] position to place the object
@@ -191,15 +399,11 @@ def register_meshy_tools(mcp: FastMCP):
             str: Success message with details or error information
         """
         try:
-            if not config.meshy_api_key:
-                return "Error: MESHY_API_KEY environment variable not set. Please set your Meshy API key."
+            logger.info("Starting mesh generation from image: %s", image_url)
             
-            logger.info(f"Starting mesh generation from image: {image_url}")
-            
-            headers = {
-                "Authorization": f"Bearer {config.meshy_api_key}",
-                "Content-Type": "application/json"
-            }
+            # Meshy can't reach local files, so send their contents inline as a data URI
+            if os.path.isfile(image_url):
+                image_url = await asyncio.to_thread(_image_data_uri, image_url)
             
             # Prepare the generation request
             generation_data = {
@@ -208,82 +412,44 @@ def register_meshy_tools(mcp: FastMCP):
             }
             
             # Create the generation task - Updated endpoint
-            response = requests.post(
+            client = await _meshy_client()
+            response = await client.post(
                 f"{config.meshy_base_url}/v2/image-to-3d",
-                headers=headers,
-                json=generation_data,
-                timeout=30
+                json=generation_data
             )
             
             if response.status_code not in [200, 202]:
                 return f"Error creating image-to-3D task: {response.status_code} - {response.text}"
             
-            task_data = response.json()
+            task_data = loads(response.content)
             task_id = task_data.get("result")
             
             if not task_id:
                 return f"Error: No task ID returned from Meshy API. Response: {task_data}"
             
-            logger.info(f"Image-to-3D task created with ID: {task_id}")
+            logger.info("Image-to-3D task created with ID: %s", task_id)
             
             # Poll for completion (similar to text-to-3D)
-            max_wait_time = config.meshy_timeout
-            check_interval = 15  # Image-to-3D might take longer
-            elapsed_time = 0
-            
-            while elapsed_time < max_wait_time:
-                status_response = requests.get(
-                    f"{config.meshy_base_url}/v2/image-to-3d/{task_id}",
-                    headers=headers,
-                    timeout=30
-                )
-                
-                if status_response.status_code != 200:
-                    return f"Error checking task status: {status_response.status_code} - {status_response.text}"
-                
-                status_data = status_response.json()
-                status = status_data.get("status")
-                
-                logger.info(f"Task status: {status}")
-                
-                if status == "SUCCEEDED":
-                    model_urls = status_data.get("model_urls", {})
-                    
-                    if not model_urls:
-                        return "Error: No model URLs in completed task"
-                    
-                    download_url = model_urls.get("glb") or model_urls.get("fbx") or model_urls.get("obj")
-                    
-                    if not download_url:
-                        return f"Error: No supported model format found. Available formats: {list(model_urls.keys())}"
-                    
-                    logger.info(f"Image-to-3D generation completed! Download URL: {download_url}")
-                    
-                    result_message = f"Mesh generated successfully from image! Download URL: {download_url}"
-                    
-                    if import_to_godot:
-                        download_result = _download_mesh_to_project(download_url, name)
-                        return f"{result_message}\n\n{download_result}"
-                    else:
-                        return result_message
-                
-                elif status == "FAILED":
-                    error_msg = status_data.get("task_error", {}).get("message", "Unknown error")
-                    return f"Image-to-3D generation failed: {error_msg}"
-                
-                elif status in ["PENDING", "IN_PROGRESS"]:
-                    time.sleep(check_interval)
-                    elapsed_time += check_interval
-                else:
-                    return f"Unknown task status: {status}"
+            download_url, error = await _wait_for_task(
+                "image-to-3d", task_id, config.meshy_timeout, "Image-to-3D generation"
+            )
+            if error:
+                return error
+            
+            result_message = f"Mesh generated successfully from image! Download URL: {download_url}"
             
-            return f"Image-to-3D generation timeout after {max_wait_time} seconds"
+            if import_to_godot:
+                download_result, _ = await _download_mesh_to_project(download_url, name)
+                return f"{result_message}\n\n{download_result}"
+            else:
+                return result_message
             
         except Exception as e:
             return f"Error generating mesh from image: {str(e)}"
     
     @mcp.tool()
-    def check_mesh_generation_progress(
+    @_requires_meshy_key
+    async def check_mesh_generation_progress(
         ctx: Context,
         task_id: str
     ) -> str:
@@ -297,25 +463,21 @@ def register_meshy_tools(mcp: FastMCP):
             str: Current status and progress information
         """
         try:
-            if not config.meshy_api_key:
-                return "Error: MESHY_API_KEY environment variable not set. Please set your Meshy API key."
-            
-            headers = {
-                "Authorization": f"Bearer {config.meshy_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Check task status
-            status_response = requests.get(
-                f"{config.meshy_base_url}/v2/text-to-3d/{task_id}",
-                headers=headers,
-                timeout=30
-            )
-            
-            if status_response.status_code != 200:
-                return f"Error checking task status: {status_response.status_code} - {status_response.text}"
+            status_data = _task_status_cache.get(task_id)
+            if status_data is None:
+                # Check task status
+                client = await _meshy_client()
+                status_response = await client.get(
+                    f"{config.meshy_base_url}/v2/text-to-3d/{task_id}"
+                )
+                
+                if status_response.status_code != 200:
+                    return f"Error checking task status: {status_response.status_code} - {status_response.text}"
+                
+                status_data = loads(status_response.content)
+                if status_data.get("status") in _FINAL_TASK_STATUSES:
+                    _task_status_cache[task_id] = status_data
             
-            status_data = status_response.json()
             status = status_data.get("status")
             
             if status == "SUCCEEDED":
@@ -349,13 +511,14 @@ def register_meshy_tools(mcp: FastMCP):
                 return f"❓ Unknown status for task {task_id}: {status}\n" \
                        f"Full response: {status_data}"
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"Network error checking task progress: {str(e)}"
         except Exception as e:
             return f"Error checking mesh generation progress: {str(e)}"
 
     @mcp.tool()
-    def refine_generated_mesh(
+    @_requires_meshy_key
+    async def refine_generated_mesh(
         ctx: Context,
         task_id: str,
         name: str = None,
@@ -381,15 +544,7 @@ def register_meshy_tools(mcp: FastMCP):
             str: Success message with details or error information
         """
         try:
-            if not config.meshy_api_key:
-                return "Error: MESHY_API_KEY environment variable not set. Please set your Meshy API key."
-            
-            logger.info(f"Starting mesh refinement for task: {task_id}")
-            
-            headers = {
-                "Authorization": f"Bearer {config.meshy_api_key}",
-                "Content-Type": "application/json"
-            }
+            logger.info("Starting mesh refinement for task: %s", task_id)
             
             # Create refinement task
             refinement_data = {
@@ -397,82 +552,50 @@ def register_meshy_tools(mcp: FastMCP):
                 "preview_task_id": task_id
             }
             
-            response = requests.post(
+            client = await _meshy_client()
+            response = await client.post(
                 f"{config.meshy_base_url}/v2/text-to-3d",
-                headers=headers,
-                json=refinement_data,
-                timeout=30
+                json=refinement_data
             )
             
             if response.status_code not in [200, 202]:
                 return f"Error creating refinement task: {response.status_code} - {response.text}"
             
-            task_data = response.json()
+            task_data = loads(response.content)
             refine_task_id = task_data.get("result")
             
-            logger.info(f"Refinement task created with ID: {refine_task_id}")
+            logger.info("Refinement task created with ID: %s", refine_task_id)
             
             # Poll for completion (refinement takes longer)
-            max_wait_time = config.meshy_timeout * 2  # Double timeout for refinement
-            check_interval = 20
-            elapsed_time = 0
-            
-            while elapsed_time < max_wait_time:
-                status_response = requests.get(
-                    f"{config.meshy_base_url}/v2/text-to-3d/{refine_task_id}",
-                    headers=headers,
-                    timeout=30
-                )
-                
-                if status_response.status_code != 200:
-                    return f"Error checking refinement status: {status_response.status_code} - {status_response.text}"
-                
-                status_data = status_response.json()
-                status = status_data.get("status")
-                
-                logger.info(f"Refinement status: {status}")
-                
-                if status == "SUCCEEDED":
-                    model_urls = status_data.get("model_urls", {})
-                    download_url = model_urls.get("glb") or model_urls.get("fbx") or model_urls.get("obj")
-                    
-                    if not download_url:
-                        return f"No supported format in refined mesh. Available: {list(model_urls.keys())}"
-                    
-                    logger.info(f"Mesh refinement completed! Download URL: {download_url}")
-                    
-                    result_message = f"Mesh refined successfully! Download URL: {download_url}"
-                    
-                    if import_to_godot:
-                        download_result = _download_mesh_to_project(download_url, name)
-                        return f"{result_message}\n\n{download_result}"
-                    else:
-                        result = f"Mesh refined successfully! Download URL: {download_url}\n\n"
-                        result += f"**Refinement Task ID:** {refine_task_id}\n"
-                        result += f"**Note:** The refined mesh was NOT imported to Godot.\n\n"
-                        result += f"To import it, use one of these options:\n"
-                        result += f"1. Run: `import_asset` with source URL and target path\n"
-                        result += f"2. Download manually and import\n"
-                        result += f"3. Re-run refinement with `import_to_godot: true`"
-                        return result
-                
-                elif status == "FAILED":
-                    error_msg = status_data.get("task_error", {}).get("message", "Unknown error")
-                    return f"Mesh refinement failed: {error_msg}"
-                
-                elif status in ["PENDING", "IN_PROGRESS"]:
-                    time.sleep(check_interval)
-                    elapsed_time += check_interval
-                else:
-                    return f"Unknown refinement status: {status}"
+            download_url, error = await _wait_for_task(
+                "text-to-3d",
+                refine_task_id,
+                config.meshy_timeout * 2,  # Double timeout for refinement
+                "Mesh refinement"
+            )
+            if error:
+                return error
+            
+            result_message = f"Mesh refined successfully! Download URL: {download_url}"
             
-            return f"Mesh refinement timeout after {max_wait_time} seconds"
+            if import_to_godot:
+                download_result, _ = await _download_mesh_to_project(download_url, name)
+                return f"{result_message}\n\n{download_result}"
+            else:
+                result = f"{result_message}\n\n"
+                result += f"**Refinement Task ID:** {refine_task_id}\n"
+                result += f"**Note:** The refined mesh was NOT imported to Godot.\n\n"
+                result += f"To import it, use one of these options:\n"
+                result += f"1. Run: `import_asset` with source URL and target path\n"
+                result += f"2. Download manually and import\n"
+                result += f"3. Re-run refinement with `import_to_godot: true`"
+                return result
             
         except Exception as e:
             return f"Error refining mesh: {str(e)}"
 
     @mcp.tool()
-    def download_and_import_mesh(
+    async def download_and_import_mesh(
         ctx: Context,
         download_url: str,
         name: str,
@@ -492,105 +615,159 @@ def register_meshy_tools(mcp: FastMCP):
             str: Success message or error information
         """
         try:
-            logger.info(f"Downloading mesh from URL: {name}")
+            logger.info("Downloading mesh from URL: %s", name)
             # First download the mesh
-            download_result = _download_mesh_to_project(download_url, name)
+            download_result, file_path = await _download_mesh_to_project(download_url, name)
             
-            if "Error" in download_result:
+            if file_path is None:
                 return download_result
             
-            # Extract the file path from the download result
-            import re
-            match = re.search(r'`(res://[^`]+)`', download_result)
-            if match:
-                file_path = match.group(1)
-                # Now import it using import_3d_model
-                from .asset_tools import import_3d_model
-                import_result = import_3d_model(
-                    ctx=ctx,
-                    model_path=file_path,
-                    name=name,
-                    position_x=position[0] if position else 0,
-                    position_y=position[1] if position else 0,
-                    position_z=position[2] if position else 0
-                )
-                return f"{download_result}\n\n{import_result}"
-            else:
-                return f"{download_result}\n\nNote: Could not automatically import. Use import_3d_model manually."
+            # Now add it to the scene the way import_3d_model does
+            import_result = await import_model_into_scene(
+                file_path,
+                name,
+                position[:3] if position else (0.0, 0.0, 0.0)
+            )
+            return f"{download_result}\n\n{import_result}"
         except Exception as e:
             return f"Error downloading and importing mesh: {str(e)}"
 
-def _download_mesh_to_project(download_url: str, name: str = None) -> str:
-    """Helper function to download a mesh file to the Godot project."""
+async def _stream_download(download_url: str, local_path: str) -> None:
+    """Download a file to local_path in 1 MiB chunks, moving it into place once complete."""
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(local_path), suffix=".part", delete=False
+    ) as partial_file:
+        logger.info("Downloading mesh to: %s", local_path)
+        try:
+            # Not the shared Meshy client: download URLs must not receive the API key
+            async with httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=httpx.Timeout(config.meshy_download_timeout, connect=10)
+            ) as client:
+                async with client.stream("GET", download_url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size=1 << 20):
+                        # Writing a 1 MiB chunk can block, so keep it off the event loop
+                        await asyncio.to_thread(partial_file.write, chunk)
+        except BaseException:
+            partial_file.close()
+            os.remove(partial_file.name)
+            raise
+    os.replace(partial_file.name, local_path)
+
+def _evict_mesh_cache() -> None:
+    """Delete the least recently used cached meshes until the cache fits config.mesh_cache_max_bytes."""
+    entries = []
+    total_size = 0
+    with os.scandir(config.mesh_cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(".part"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+    
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= config.mesh_cache_max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
+
+async def _download_to_cache(download_url: str, extension: str) -> str:
+    """Return a local copy of download_url, downloading it only if it isn't cached yet."""
+    # Signed URLs differ in their query string only, so the path identifies the file
+    key = hashlib.sha1(download_url.split("?", 1)[0].encode()).hexdigest()[:16]
+    cached_path = os.path.join(config.mesh_cache_dir, f"{key}{extension}")
+    try:
+        if os.path.getsize(cached_path) > 0:
+            logger.info("Using cached mesh: %s", cached_path)
+            # Mark it as recently used for eviction
+            os.utime(cached_path)
+            return cached_path
+    except OSError:
+        pass
+    
+    os.makedirs(config.mesh_cache_dir, exist_ok=True)
+    await _stream_download(download_url, cached_path)
+    # Scanning and pruning up to mesh_cache_max_bytes of files blocks, so run it in a thread
+    await asyncio.to_thread(_evict_mesh_cache)
+    return cached_path
+
+async def _ensure_import_directory() -> None:
+    """Make sure config.asset_import_path exists, since Godot needs it before importing."""
+    if config.asset_import_path in _ensured_directories:
+        return
+    
+    logger.info("Ensuring directory exists: %s", config.asset_import_path)
+    async with acquire_godot_connection() as godot:
+        try:
+            await godot.send_command("GET_ASSET_LIST", {
+                "folder": config.asset_import_path
+            })
+        except GodotCommandError as e:
+            if "Unable to access directory" not in str(e):
+                raise
+            # Directory doesn't exist; creating a dummy file in it forces its creation
+            dummy_result = await godot.send_command("CREATE_SCRIPT", {
+                "script_name": ".gdignore",
+                "script_folder": config.asset_import_path.rstrip("/"),
+                "content": "# This file tells Godot to ignore this directory for scanning",
+                "overwrite": True
+            })
+            logger.info("Created directory with .gdignore: %s", dummy_result)
+    _ensured_directories.add(config.asset_import_path)
+
+async def _download_mesh_to_project(download_url: str, name: str = None) -> Tuple[str, Optional[str]]:
+    """Helper function to download a mesh file to the Godot project.
+    
+    Returns:
+        Tuple[str, Optional[str]]: Result message, and the res:// path of the mesh if it was imported
+    """
     try:
         # Generate a filename
         if not name:
             name = f"GeneratedMesh_{int(time.time())}"
         
-        # Clean the name for filename use
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
-        
-        # Determine file extension from URL
-        url_lower = download_url.lower()
-        if '.glb' in url_lower:
-            extension = '.glb'
-        elif '.fbx' in url_lower:
-            extension = '.fbx'
-        elif '.obj' in url_lower:
-            extension = '.obj'
-        else:
+        # Clean the name for filename use, falling back if nothing usable is left
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("", name).strip().replace(' ', '_')
+        if not safe_name:
+            safe_name = f"GeneratedMesh_{int(time.time())}"
+        
+        # Determine file extension from the URL path; signed URLs carry a query string
+        extension = posixpath.splitext(urlsplit(download_url).path)[1].lower()
+        if extension not in _MESH_EXTENSIONS:
             extension = '.glb'  # Default
         
         filename = f"{safe_name}{extension}"
-        local_path = f"/tmp/{filename}"
-        
-        logger.info(f"Downloading mesh to: {local_path}")
-        
-        # Download the file
-        urllib.request.urlretrieve(download_url, local_path)
-        
-        # Import to Godot
         target_path = f"{config.asset_import_path}{filename}"
         
-        godot = get_godot_connection()
-        
-        # First, ensure the target directory exists by creating a dummy file
-        # This is necessary because Godot needs the directory to exist before importing
-        logger.info(f"Ensuring directory exists: {config.asset_import_path}")
+        # The download and the directory check don't depend on each other, so overlap them
+        local_path, directory_result = await asyncio.gather(
+            _download_to_cache(download_url, extension),
+            _ensure_import_directory(),
+            return_exceptions=True
+        )
+        if isinstance(local_path, BaseException):
+            raise local_path
+        if isinstance(directory_result, BaseException):
+            raise directory_result
         
-        # Check if the asset directory exists, create it if not
-        check_dir_result = godot.send_command("GET_ASSET_LIST", {
-            "folder": config.asset_import_path
-        })
-        
-        if "error" in check_dir_result and "Unable to access directory" in check_dir_result.get("error", ""):
-            # Directory doesn't exist, we need to create it
-            # Create a dummy file to force directory creation
-            dummy_path = f"{config.asset_import_path}.gdignore"
-            dummy_result = godot.send_command("CREATE_SCRIPT", {
-                "script_name": ".gdignore",
-                "script_folder": config.asset_import_path.rstrip("/"),
-                "content": "# This file tells Godot to ignore this directory for scanning",
-                "overwrite": True
-            })
-            logger.info(f"Created directory with .gdignore: {dummy_result}")
-        
-        # Now import the asset
-        import_result = godot.send_command("IMPORT_ASSET", {
-            "source_path": local_path,
-            "target_path": target_path,
-            "overwrite": True
-        })
-        
-        if "error" in import_result:
-            return f"Error: Failed to copy file to Godot project: {import_result['error']}"
-        
-        # Clean up temporary file
+        # Import to Godot; the cached file stays for later imports
         try:
-            os.remove(local_path)
-        except:
-            pass
+            async with acquire_godot_connection() as godot:
+                await godot.send_command("IMPORT_ASSET", {
+                    "source_path": local_path,
+                    "target_path": target_path,
+                    "overwrite": True
+                })
+        except GodotCommandError as e:
+            # The directory may have been removed since it was checked
+            _ensured_directories.discard(config.asset_import_path)
+            return f"Error: Failed to copy file to Godot project: {str(e)}", None
+        invalidate_asset_list_cache()
         
         success_msg = f"✅ **Mesh Downloaded Successfully!**\n\n"
         success_msg += f"**File:** `{target_path}`\n"
@@ -598,7 +775,7 @@ def _download_mesh_to_project(download_url: str, name: str = None) -> str:
         success_msg += f"The mesh has been downloaded to your project.\n"
         success_msg += f"Use `import_3d_model` to add it to your scene."
         
-        return success_msg
+        return success_msg, target_path
         
     except Exception as e:
-        return f"Error importing mesh to Godot: {str(e)}" 
\ No newline at end of file
+        return f"Error importing mesh to Godot: {str(e)}", None 
\ No newline at end of file
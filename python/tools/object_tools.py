@@ -1,14 +1,39 @@
 # tools/object_tools.py
+from dataclasses import dataclass
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any, List, Optional
-from godot_connection import get_godot_connection
-import json
+from godot_connection import get_godot_connection_pool, GodotCommandError
+from ._paths import normalize_res_file_path
+
+# Tree drawing pieces, shared by every line of get_hierarchy's output
+_CONNECTOR_LAST = "└─"
+_CONNECTOR_MID = "├─"
+_BRANCH_LAST = "    "
+_BRANCH_MID = "│   "
+
+@dataclass
+class _HierarchyArrays:
+    """A scene hierarchy as parallel per-node lists in pre-order; the root is index 0.
+    
+    parents holds each node's parent index (-1 for the root). Walking these lists
+    avoids a dict lookup per field per node when formatting large scenes.
+    """
+    names: List[str]
+    types: List[str]
+    scripts: List[Optional[str]]
+    positions: List[Optional[List[float]]]
+    parents: List[int]
 
 def register_object_tools(mcp: FastMCP):
     """Register all object inspection and manipulation tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    pool = get_godot_connection_pool()
+    acquire_godot_connection = pool.acquire
+    # Independent writes go through this so concurrent ones share a BATCH
+    send_coalesced_command = pool.send_coalesced
     
     @mcp.tool()
-    def get_object_properties(ctx: Context, name: str) -> Dict[str, Any]:
+    async def get_object_properties(ctx: Context, name: str) -> Dict[str, Any]:
         """Get all properties of a specified object (node).
         
         Args:
@@ -19,9 +44,10 @@ def register_object_tools(mcp: FastMCP):
             Dict: Object containing the node's properties, components, and their values
         """
         try:
-            response = get_godot_connection().send_command("GET_OBJECT_PROPERTIES", {
-                "name": name
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("GET_OBJECT_PROPERTIES", {
+                    "name": name
+                })
             
             if "error" in response:
                 return {"error": response["error"]}
@@ -31,7 +57,7 @@ def register_object_tools(mcp: FastMCP):
             return {"error": f"Failed to get object properties: {str(e)}"}
             
     @mcp.tool()
-    def get_hierarchy(ctx: Context) -> str:
+    async def get_hierarchy(ctx: Context) -> str:
         """Get the detailed hierarchy of objects in the current scene.
         
         Args:
@@ -41,60 +67,75 @@ def register_object_tools(mcp: FastMCP):
             str: JSON string containing the complete scene hierarchy
         """
         try:
-            scene_info = get_godot_connection().send_command("GET_SCENE_INFO")
+            async with acquire_godot_connection() as godot:
+                # Only names, types, scripts and positions are shown, sent as parallel arrays
+                scene_info = await godot.send_command("GET_SCENE_INFO", {"compact": True, "columns": True})
             
             if "error" in scene_info:
                 return f"Error: {scene_info['error']}"
             
-            # Format the hierarchy for better readability
-            formatted_result = {
-                "scene_name": scene_info.get("name", "Unknown"),
-                "scene_path": scene_info.get("path", "Unknown"),
-            }
+            columns = scene_info.get("columns")
+            if columns is None:
+                return "Error getting hierarchy: Godot returned no hierarchy columns"
             
-            # Include the full hierarchy if available
-            if "hierarchy" in scene_info:
-                formatted_result["hierarchy"] = scene_info["hierarchy"]
-                
-                # Print a more readable tree representation
-                tree_view = _format_node_tree(scene_info["hierarchy"], indent="")
-                return f"Scene: {formatted_result['scene_name']} ({formatted_result['scene_path']})\n\n{tree_view}"
-            else:
-                # Fall back to the simple root_objects list if full hierarchy isn't available
-                formatted_result["root_objects"] = scene_info.get("root_objects", [])
-                return json.dumps(formatted_result, indent=2)
+            arrays = _HierarchyArrays(
+                columns["names"], columns["types"], columns["scripts"],
+                columns["positions"], columns["parents"]
+            )
+            # Print a more readable tree representation
+            tree_view = _format_node_tree(arrays)
+            return f"Scene: {scene_info.get('name', 'Unknown')} ({scene_info.get('path', 'Unknown')})\n\n{tree_view}"
                 
         except Exception as e:
             return f"Error getting hierarchy: {str(e)}"
 
-    def _format_node_tree(node_data, indent=""):
+    def _format_node_tree(arrays: _HierarchyArrays):
         """Helper function to format node hierarchy as a tree view."""
-        result = f"{indent}└─ {node_data['name']} ({node_data['type']})"
-        
-        # Add script info if available
-        if "script" in node_data:
-            result += f" [Script: {node_data['script']}]"
+        parents = arrays.parents
+        names, types, scripts, positions = arrays.names, arrays.types, arrays.scripts, arrays.positions
+        count = len(parents)
         
-        # Add transform info for 3D nodes
-        if "transform" in node_data:
-            pos = node_data["transform"].get("position", [0, 0, 0])
-            pos_str = f"({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f})" if len(pos) >= 3 else f"({pos[0]:.1f}, {pos[1]:.1f})"
-            result += f" at {pos_str}"
+        # A node is the last of its siblings if no later node shares its parent
+        last_child = {}
+        for i in range(count):
+            last_child[parents[i]] = i
         
-        # Process children with increased indentation
-        if "children" in node_data and node_data["children"]:
-            result += "\n"
-            for i, child in enumerate(node_data["children"]):
-                # Use different indentation for last child
-                is_last = i == len(node_data["children"]) - 1
-                child_indent = indent + ("    " if is_last else "│   ")
-                result += _format_node_tree(child, child_indent) + "\n"
+        # Indent of each node's own line; the prefix its children share is built
+        # once, when the first child is reached, so leaves allocate no prefix
+        indents = [""] * count
+        child_prefixes = {}
+        lines = []
+        for i in range(count):
+            parent = parents[i]
+            if parent >= 0:
+                indent = child_prefixes.get(parent)
+                if indent is None:
+                    indent = indents[parent] + (_BRANCH_LAST if last_child[parents[parent]] == parent else _BRANCH_MID)
+                    child_prefixes[parent] = indent
+                indents[i] = indent
+            else:
+                indent = ""
+            
+            # Add script info if available
+            script = scripts[i]
+            script_str = f" [Script: {script}]" if script is not None else ""
+            
+            # Add transform info for 2D and 3D nodes; a scene can mix both, so check per node
+            pos = positions[i]
+            if pos is None:
+                pos_str = ""
+            elif len(pos) >= 3:
+                pos_str = f" at ({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f})"
+            else:
+                pos_str = f" at ({pos[0]:.1f}, {pos[1]:.1f})"
+            
+            connector = _CONNECTOR_LAST if last_child[parent] == i else _CONNECTOR_MID
+            lines.append(f"{indent}{connector} {names[i]} ({types[i]}){script_str}{pos_str}")
         
-        return result.rstrip()
-
+        return "\n".join(lines)
 
     @mcp.tool()
-    def rename_node(
+    async def rename_node(
         ctx: Context,
         old_name: str,
         new_name: str
@@ -110,39 +151,21 @@ def register_object_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Check if node with old_name exists
-            old_response = get_godot_connection().send_command("FIND_OBJECTS_BY_NAME", {
-                "name": old_name
-            })
-            
-            node_exists = len(old_response.get("objects", [])) > 0
-            if not node_exists:
-                return f"Error: Node '{old_name}' not found"
-                
-            # Check if new_name is already taken
-            new_response = get_godot_connection().send_command("FIND_OBJECTS_BY_NAME", {
-                "name": new_name
-            })
+            # Godot checks that old_name exists and new_name is free before renaming
+            async with acquire_godot_connection() as godot:
+                await godot.send_command("RENAME_NODE", {
+                    "old_name": old_name,
+                    "new_name": new_name
+                })
             
-            name_taken = len(new_response.get("objects", [])) > 0
-            if name_taken:
-                return f"Error: Name '{new_name}' is already taken by another node"
-                
-            # Rename the node
-            rename_response = get_godot_connection().send_command("RENAME_NODE", {
-                "old_name": old_name,
-                "new_name": new_name
-            })
-            
-            if "error" in rename_response:
-                return f"Error renaming node: {rename_response['error']}"
-                
             return f"Renamed node from '{old_name}' to '{new_name}'"
+        except GodotCommandError as e:
+            return f"Error: {str(e)}"
         except Exception as e:
             return f"Error renaming node: {str(e)}"
             
     @mcp.tool()
-    def set_property(
+    async def set_property(
         ctx: Context,
         node_name: str,
         property_name: str,
@@ -160,25 +183,21 @@ def register_object_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Check input parameters
-            if not node_name or not isinstance(node_name, str):
+            # FastMCP has already validated the argument types against the signature,
+            # so only empty names are left to reject
+            if not node_name:
                 return "Error: Invalid node_name parameter"
             
-            if not property_name or not isinstance(property_name, str):
+            if not property_name:
                 return "Error: Invalid property_name parameter"
             
             # Handle special cases
             if property_name == "script" and isinstance(value, str):
-                # Ensure script path starts with res://
-                if not value.startswith("res://"):
-                    value = "res://" + value
-                
-                # Ensure script has .gd extension if no extension provided
-                if "." not in value.split("/")[-1]:
-                    value += ".gd"
+                # Ensure a res:// script path, defaulting to a .gd extension
+                value = normalize_res_file_path(value, ".gd")
             
             # Send the command
-            response = get_godot_connection().send_command("SET_PROPERTY", {
+            response = await send_coalesced_command("SET_PROPERTY", {
                 "node_name": node_name,
                 "property_name": property_name,
                 "value": value
@@ -189,7 +208,7 @@ def register_object_tools(mcp: FastMCP):
             return f"Error setting property: {str(e)}"
         
     @mcp.tool()
-    def create_child_object(
+    async def create_child_object(
         ctx: Context,
         parent_name: str,
         type: str = "EMPTY",
@@ -230,11 +249,13 @@ def register_object_tools(mcp: FastMCP):
             if scale:
                 params["scale"] = scale
             
-            response = get_godot_connection().send_command("CREATE_CHILD_OBJECT", params)
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("CREATE_CHILD_OBJECT", params)
             
-            if isinstance(response, dict) and "name" in response:
+            created_name = response.get("name") if isinstance(response, dict) else None
+            if created_name:
                 node_type = response.get("type", type)
-                return f"Created {node_type} object: {response['name']} as child of {parent_name}"
+                return f"Created {node_type} object: {created_name} as child of {parent_name}"
             else:
                 return f"Created {type} object as child of {parent_name}"
         except Exception as e:
@@ -242,7 +263,7 @@ def register_object_tools(mcp: FastMCP):
         
 
     @mcp.tool()
-    def set_mesh(
+    async def set_mesh(
         ctx: Context,
         node_name: str,
         mesh_type: str,
@@ -281,14 +302,14 @@ def register_object_tools(mcp: FastMCP):
             if mesh_params:
                 params["mesh_params"] = mesh_params
             
-            response = get_godot_connection().send_command("SET_MESH", params)
+            response = await send_coalesced_command("SET_MESH", params)
             return response.get("message", f"Set {mesh_type} on node '{node_name}'")
         except Exception as e:
             return f"Error setting mesh: {str(e)}"
         
 
     @mcp.tool()
-    def set_collision_shape(
+    async def set_collision_shape(
         ctx: Context,
         node_name: str,
         shape_type: str,
@@ -327,13 +348,13 @@ def register_object_tools(mcp: FastMCP):
             if shape_params:
                 params["shape_params"] = shape_params
             
-            response = get_godot_connection().send_command("SET_COLLISION_SHAPE", params)
+            response = await send_coalesced_command("SET_COLLISION_SHAPE", params)
             return response.get("message", f"Set {shape_type} on node '{node_name}'")
         except Exception as e:
             return f"Error setting collision shape: {str(e)}"
         
     @mcp.tool()
-    def set_nested_property(
+    async def set_nested_property(
         ctx: Context,
         node_name: str,
         property_name: str,
@@ -362,7 +383,7 @@ def register_object_tools(mcp: FastMCP):
             if value_type:
                 params["value_type"] = value_type
             
-            response = get_godot_connection().send_command("SET_NESTED_PROPERTY", params)
+            response = await send_coalesced_command("SET_NESTED_PROPERTY", params)
             return response.get("message", f"Set nested property {property_name} on {node_name}")
         except Exception as e:
             return f"Error setting nested property: {str(e)}"
\ No newline at end of file
@@ -1,32 +1,35 @@
 # tools/scene_tools.py
 from mcp.server.fastmcp import FastMCP, Context
 from typing import Dict, Any, List
-import json
-from godot_connection import get_godot_connection
-from mcp.server.fastmcp import FastMCP, Context
-from typing import Dict, Any
-import json
-from godot_connection import get_godot_connection
+from godot_connection import get_godot_connection_pool
+from ._json import dumps_indented
+from ._paths import normalize_res_path
+from .asset_tools import invalidate_asset_list_cache
 
 def register_scene_tools(mcp: FastMCP):
     """Register all scene-related tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    pool = get_godot_connection_pool()
+    acquire_godot_connection = pool.acquire
+    # Independent writes go through this so concurrent ones share a BATCH
+    send_coalesced_command = pool.send_coalesced
     
     @mcp.tool()
-    def get_scene_info(ctx: Context) -> str:
+    async def get_scene_info(ctx: Context) -> str:
         """Get information about the current scene.
         
         Returns:
             str: JSON string containing scene information
         """
         try:
-            godot = get_godot_connection()
-            result = godot.send_command("GET_SCENE_INFO")
-            return json.dumps(result, indent=2)
+            async with acquire_godot_connection() as godot:
+                result = await godot.send_command("GET_SCENE_INFO")
+            return dumps_indented(result)
         except Exception as e:
             return f"Error getting scene info: {str(e)}"
 
     @mcp.tool()
-    def open_scene(ctx: Context, scene_path: str, save_current: bool = False) -> str:
+    async def open_scene(ctx: Context, scene_path: str, save_current: bool = False) -> str:
         """Open a scene from the project.
         
         Args:
@@ -38,24 +41,20 @@ def register_scene_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Ensure path starts with res://
-            if not scene_path.startswith("res://"):
-                scene_path = "res://" + scene_path
-            
-            # Ensure it has .tscn extension
-            if not scene_path.endswith(".tscn") and not scene_path.endswith(".scn"):
-                scene_path += ".tscn"
-            
-            response = get_godot_connection().send_command("OPEN_SCENE", {
-                "scene_path": scene_path,
-                "save_current": save_current
-            })
+            # Ensure a res:// path with a scene extension
+            scene_path = normalize_res_path(scene_path, ".tscn", (".scn",))
+            
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("OPEN_SCENE", {
+                    "scene_path": scene_path,
+                    "save_current": save_current
+                })
             return response.get("message", "Scene opened successfully")
         except Exception as e:
             return f"Error opening scene: {str(e)}"
 
     @mcp.tool()
-    def save_scene(ctx: Context) -> str:
+    async def save_scene(ctx: Context) -> str:
         """Save the current scene.
         
         Args:
@@ -65,13 +64,15 @@ def register_scene_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            response = get_godot_connection().send_command("SAVE_SCENE")
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("SAVE_SCENE")
+            invalidate_asset_list_cache()
             return response.get("message", "Scene saved successfully")
         except Exception as e:
             return f"Error saving scene: {str(e)}"
 
     @mcp.tool()
-    def new_scene(ctx: Context, scene_path: str, overwrite: bool = False) -> str:
+    async def new_scene(ctx: Context, scene_path: str, overwrite: bool = False) -> str:
         """Create a new empty scene.
         
         Args:
@@ -83,24 +84,21 @@ def register_scene_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Ensure path starts with res://
-            if not scene_path.startswith("res://"):
-                scene_path = "res://" + scene_path
-            
-            # Ensure it has .tscn extension
-            if not scene_path.endswith(".tscn"):
-                scene_path += ".tscn"
-            
-            response = get_godot_connection().send_command("NEW_SCENE", {
-                "scene_path": scene_path,
-                "overwrite": overwrite
-            })
+            # Ensure a res:// path with a .tscn extension
+            scene_path = normalize_res_path(scene_path, ".tscn")
+            
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("NEW_SCENE", {
+                    "scene_path": scene_path,
+                    "overwrite": overwrite
+                })
+            invalidate_asset_list_cache()
             return response.get("message", "New scene created successfully")
         except Exception as e:
             return f"Error creating new scene: {str(e)}"
 
     @mcp.tool()
-    def create_object(
+    async def create_object(
         ctx: Context,
         type: str = "EMPTY",
         name: str = None,
@@ -139,18 +137,20 @@ def register_scene_tools(mcp: FastMCP):
                 params["scale"] = scale
             params["replace_if_exists"] = replace_if_exists
             
-            response = get_godot_connection().send_command("CREATE_OBJECT", params)
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("CREATE_OBJECT", params)
             
-            if isinstance(response, dict) and "name" in response:
+            created_name = response.get("name") if isinstance(response, dict) else None
+            if created_name:
                 node_type = response.get("type", type)
-                return f"Created {node_type} object: {response['name']}"
+                return f"Created {node_type} object: {created_name}"
             else:
                 return f"Created {type} object"
         except Exception as e:
             return f"Error creating object: {str(e)}"
     
     @mcp.tool()
-    def delete_object(ctx: Context, name: str) -> str:
+    async def delete_object(ctx: Context, name: str) -> str:
         """Delete an object (node) from the current scene.
         
         Args:
@@ -161,15 +161,16 @@ def register_scene_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            response = get_godot_connection().send_command("DELETE_OBJECT", {
-                "name": name
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("DELETE_OBJECT", {
+                    "name": name
+                })
             return response.get("message", f"Object deleted: {name}")
         except Exception as e:
             return f"Error deleting object: {str(e)}"
             
     @mcp.tool()
-    def find_objects_by_name(ctx: Context, name: str) -> str:
+    async def find_objects_by_name(ctx: Context, name: str) -> str:
         """Find objects in the scene by name (partial matches supported).
         
         Args:
@@ -180,20 +181,21 @@ def register_scene_tools(mcp: FastMCP):
             str: JSON string with list of found objects or error details
         """
         try:
-            response = get_godot_connection().send_command("FIND_OBJECTS_BY_NAME", {
-                "name": name
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("FIND_OBJECTS_BY_NAME", {
+                    "name": name
+                })
             
             objects = response.get("objects", [])
             if not objects:
                 return f"No objects found with name containing '{name}'"
                 
-            return json.dumps(objects, indent=2)
+            return dumps_indented(objects)
         except Exception as e:
             return f"Error finding objects: {str(e)}"
             
     @mcp.tool()
-    def set_object_transform(
+    async def set_object_transform(
         ctx: Context,
         name: str,
         location: List[float] = None,
@@ -221,13 +223,13 @@ def register_scene_tools(mcp: FastMCP):
             if scale:
                 params["scale"] = scale
                 
-            response = get_godot_connection().send_command("SET_OBJECT_TRANSFORM", params)
+            response = await send_coalesced_command("SET_OBJECT_TRANSFORM", params)
             return response.get("message", f"Transform updated for {name}")
         except Exception as e:
             return f"Error setting transform: {str(e)}"
             
     @mcp.tool()
-    def get_object_properties(ctx: Context, name: str) -> str:
+    async def get_object_properties(ctx: Context, name: str) -> str:
         """Get all properties of an object.
         
         Args:
@@ -238,13 +240,14 @@ def register_scene_tools(mcp: FastMCP):
             str: JSON string with object properties or error details
         """
         try:
-            response = get_godot_connection().send_command("GET_OBJECT_PROPERTIES", {
-                "name": name
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("GET_OBJECT_PROPERTIES", {
+                    "name": name
+                })
             
             if "error" in response:
                 return f"Error: {response['error']}"
                 
-            return json.dumps(response, indent=2)
+            return dumps_indented(response)
         except Exception as e:
             return f"Error getting object properties: {str(e)}"
\ No newline at end of file
@@ -1,13 +1,47 @@
 # tools/script_tools.py
+import posixpath
+import time
+from collections import OrderedDict
 from mcp.server.fastmcp import FastMCP, Context
-from typing import List
-from godot_connection import get_godot_connection
+from typing import Dict, List, Optional, Tuple
+from godot_connection import get_godot_connection_pool
+from config import config
+from ._paths import normalize_res_path, normalize_res_file_path
+from .asset_tools import invalidate_asset_list_cache
+
+# Script contents keyed by (path, mtime reported by Godot), least recently used first
+_SCRIPT_CACHE_SIZE = 256
+_script_cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+# Script listings by (folder, offset, limit), reused for config.asset_list_cache_ttl
+_script_list_cache: Dict[Tuple[str, int, Optional[int]], Tuple[float, str]] = {}
+
+def _cache_script(script_path: str, mtime: int, content: str) -> None:
+    """Store a script's contents, evicting the least recently viewed ones."""
+    _script_cache[(script_path, mtime)] = content
+    _script_cache.move_to_end((script_path, mtime))
+    while len(_script_cache) > _SCRIPT_CACHE_SIZE:
+        _script_cache.popitem(last=False)
+
+def invalidate_script_cache(script_path: Optional[str] = None) -> None:
+    """Drop cached contents of one script (or all of them) and every cached listing.
+    
+    Godot reports mtimes in whole seconds, so writes made through the tools
+    invalidate explicitly instead of relying on the mtime changing.
+    """
+    if script_path is None:
+        _script_cache.clear()
+    else:
+        for key in [key for key in _script_cache if key[0] == script_path]:
+            del _script_cache[key]
+    _script_list_cache.clear()
 
 def register_script_tools(mcp: FastMCP):
     """Register all script-related tools with the MCP server."""
+    # Bound once so tool calls skip the pool lookup
+    acquire_godot_connection = get_godot_connection_pool().acquire
     
     @mcp.tool()
-    def view_script(ctx: Context, script_path: str, require_exists: bool = True) -> str:
+    async def view_script(ctx: Context, script_path: str, require_exists: bool = True) -> str:
         """View the contents of a Godot script file.
         
         Args:
@@ -19,28 +53,37 @@ def register_script_tools(mcp: FastMCP):
             str: The contents of the script file or error message
         """
         try:
-            # Ensure path starts with res://
-            if not script_path.startswith("res://"):
-                script_path = "res://" + script_path
-                
-            # Ensure it has .gd extension if no extension is provided
-            if "." not in script_path.split("/")[-1]:
-                script_path += ".gd"
+            # Ensure a res:// path, defaulting to a .gd extension
+            script_path = normalize_res_file_path(script_path, ".gd")
             
-            response = get_godot_connection().send_command("VIEW_SCRIPT", {
-                "script_path": script_path,
-                "require_exists": require_exists
-            })
+            async with acquire_godot_connection() as godot:
+                # A stat is much cheaper than shipping the whole file when it hasn't changed
+                stat = await godot.send_command("STAT_SCRIPT", {"script_path": script_path})
+                if stat.get("exists"):
+                    key = (script_path, stat["mtime"])
+                    content = _script_cache.get(key)
+                    if content is not None:
+                        _script_cache.move_to_end(key)
+                        return content
+                
+                response = await godot.send_command("VIEW_SCRIPT", {
+                    "script_path": script_path,
+                    "require_exists": require_exists
+                })
             
             if response.get("exists", True):
-                return response.get("content", "Script contents not available")
+                content = response.get("content")
+                if content is None:
+                    return "Script contents not available"
+                _cache_script(script_path, response["mtime"], content)
+                return content
             else:
                 return response.get("message", "Script not found")
         except Exception as e:
             return f"Error viewing script: {str(e)}"
 
     @mcp.tool()
-    def create_script(
+    async def create_script(
         ctx: Context,
         script_name: str,
         script_type: str = "Node",
@@ -68,9 +111,7 @@ def register_script_tools(mcp: FastMCP):
             if not script_name.endswith(".gd"):
                 script_name += ".gd"
                 
-            # Ensure script_folder starts with res://
-            if not script_folder.startswith("res://"):
-                script_folder = "res://" + script_folder
+            script_folder = normalize_res_path(script_folder)
             
             params = {
                 "script_name": script_name,
@@ -85,13 +126,16 @@ def register_script_tools(mcp: FastMCP):
             if content:
                 params["content"] = content
                 
-            response = get_godot_connection().send_command("CREATE_SCRIPT", params)
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("CREATE_SCRIPT", params)
+            invalidate_script_cache(normalize_res_file_path(posixpath.join(script_folder, script_name), ".gd"))
+            invalidate_asset_list_cache()
             return response.get("message", "Script created successfully")
         except Exception as e:
             return f"Error creating script: {str(e)}"
 
     @mcp.tool()
-    def update_script(
+    async def update_script(
         ctx: Context,
         script_path: str,
         content: str,
@@ -111,49 +155,66 @@ def register_script_tools(mcp: FastMCP):
             str: Success message or error details
         """
         try:
-            # Ensure path starts with res://
-            if not script_path.startswith("res://"):
-                script_path = "res://" + script_path
-                
-            # Ensure it has .gd extension if no extension is provided
-            if "." not in script_path.split("/")[-1]:
-                script_path += ".gd"
+            # Ensure a res:// path, defaulting to a .gd extension
+            script_path = normalize_res_file_path(script_path, ".gd")
             
-            response = get_godot_connection().send_command("UPDATE_SCRIPT", {
-                "script_path": script_path,
-                "content": content,
-                "create_if_missing": create_if_missing,
-                "create_folder_if_missing": create_folder_if_missing
-            })
+            async with acquire_godot_connection() as godot:
+                response = await godot.send_command("UPDATE_SCRIPT", {
+                    "script_path": script_path,
+                    "content": content,
+                    "create_if_missing": create_if_missing,
+                    "create_folder_if_missing": create_folder_if_missing
+                })
+            invalidate_script_cache(script_path)
             
             return response.get("message", "Script updated successfully")
         except Exception as e:
             return f"Error updating script: {str(e)}"
 
     @mcp.tool()
-    def list_scripts(ctx: Context, folder_path: str = "res://") -> str:
+    async def list_scripts(
+        ctx: Context,
+        folder_path: str = "res://",
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> str:
         """List all script files in a specified folder.
         
         Args:
             ctx: The MCP context
             folder_path: Path to the folder to search (default: "res://")
+            offset: Number of scripts to skip, for paging through large folders
+            limit: Maximum number of scripts to return (default: all)
             
         Returns:
             str: List of script files or error message
         """
         try:
-            # Ensure path starts with res://
-            if not folder_path.startswith("res://"):
-                folder_path = "res://" + folder_path
+            folder_path = normalize_res_path(folder_path)
             
-            response = get_godot_connection().send_command("LIST_SCRIPTS", {
-                "folder_path": folder_path
-            })
+            key = (folder_path, offset, limit)
+            now = time.monotonic()
+            cached = _script_list_cache.get(key)
+            if cached is not None and now - cached[0] < config.asset_list_cache_ttl:
+                text = cached[1]
+            else:
+                params = {"folder_path": folder_path, "format": "text"}
+                if offset:
+                    params["offset"] = offset
+                if limit is not None:
+                    params["limit"] = limit
+                
+                async with acquire_godot_connection() as godot:
+                    response = await godot.send_command("LIST_SCRIPTS", params)
+                
+                text = response.get("text")
+                if text is None:
+                    return "Error listing scripts: Godot returned no script listing"
+                _script_list_cache[key] = (now, text)
             
-            scripts = response.get("scripts", [])
-            if not scripts:
+            if not text:
                 return "No scripts found in the specified folder"
                 
-            return "\n".join(scripts)
+            return text
         except Exception as e:
-            return f"Error listing scripts: {str(e)}"
\ No newline at end of file
+            return f"Error listing scripts: {str(e)}"